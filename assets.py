@@ -0,0 +1,170 @@
+from settings import *
+from collections import OrderedDict
+from memory import memory
+import weakref
+
+class AssetCache:
+    def __init__(self, budget):
+        """
+        Registro compartido de imágenes y sonidos del proceso.
+        Cada archivo se lee una sola vez; las imágenes se guardan por ruta y parámetros de
+        transformación (escala, rotación, volteo) y todos los que piden la misma combinación
+        reciben la misma Surface, que por tanto no debe modificarse en sitio.
+        Args:
+            budget (int): Presupuesto en bytes para las imágenes en caché. Al superarlo se
+                          descartan las menos usadas recientemente (LRU).
+        Atributos:
+            images (OrderedDict): Clave -> Surface, ordenado de menos a más usado recientemente.
+            atlas_images (dict): Clave -> subsuperficie de un atlas (ver atlas.py); no cuentan
+                                 para el presupuesto porque comparten la memoria del atlas.
+            atlases (dict): Categoría -> superficie completa del atlas.
+            sounds (dict): Ruta -> pygame.mixer.Sound.
+            masks (WeakKeyDictionary): Surface -> pygame.mask.Mask para las colisiones por máscara.
+            silhouettes (WeakKeyDictionary): Surface -> silueta blanca con fondo transparente.
+            used_bytes (int): Bytes ocupados por las imágenes en caché.
+            hits (int): Peticiones servidas desde la caché.
+            misses (int): Peticiones que tuvieron que cargar o transformar.
+        """
+        self.budget = budget
+        self.images = OrderedDict()
+        self.atlas_images = {}
+        self.atlases = {}
+        self.sounds = {}
+        self.masks = weakref.WeakKeyDictionary()
+        self.silhouettes = weakref.WeakKeyDictionary()
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def surface_bytes(surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    @staticmethod
+    def key(path, scale=None, rotation=0, flip=(False, False), alpha=True):
+        # clave de caché de una imagen transformada; la usan también las cargas en segundo plano
+        return (path, scale, rotation, tuple(flip), alpha)
+
+    def image(self, path, scale=None, rotation=0, flip=(False, False), alpha=True):
+        """
+        Devuelve la imagen de `path` con las transformaciones pedidas, cargándola solo si no está en caché.
+        Las transformaciones se aplican en este orden: escala, rotación (rotozoom) y volteo.
+        Args:
+            path (str): Ruta del archivo de imagen.
+            scale (tuple, opcional): Tamaño final (ancho, alto).
+            rotation (float, opcional): Ángulo en grados para pygame.transform.rotozoom.
+            flip (tuple, opcional): Volteo (horizontal, vertical).
+            alpha (bool, opcional): Usa convert_alpha() si es True y convert() si es False.
+        Returns:
+            pygame.Surface: Superficie compartida.
+        """
+        key = self.key(path, scale, rotation, flip, alpha)
+        surface = self.atlas_images.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+        surface = self.images.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.images.move_to_end(key)
+            return surface
+        self.misses += 1
+
+        if scale is None and rotation == 0 and not any(flip):
+            surface = self.load(path, alpha)
+        else:
+            # la imagen original solo se reutiliza si ya estaba en caché; si no, se descarta tras transformarla
+            surface = self.images.get(self.key(path, alpha=alpha))
+            if surface is None:
+                surface = self.load(path, alpha)
+            if scale is not None:
+                surface = pygame.transform.scale(surface, scale)
+            if rotation:
+                surface = pygame.transform.rotozoom(surface, rotation, 1)
+            if any(flip):
+                surface = pygame.transform.flip(surface, flip[0], flip[1])
+        self.store(key, surface)
+        return surface
+
+    @staticmethod
+    def load(path, alpha):
+        surface = pygame.image.load(path)
+        return surface.convert_alpha() if alpha else surface.convert()
+
+    def store(self, key, surface):
+        # guarda una superficie en caché y aplica el presupuesto de memoria
+        if key in self.images:
+            self.used_bytes -= self.surface_bytes(self.images.pop(key))
+        self.images[key] = surface
+        self.used_bytes += self.surface_bytes(surface)
+        memory.track(surface, 'asset' if key[1:4] == (None, 0, (False, False)) else 'transform')
+        while self.used_bytes > self.budget and len(self.images) > 1:
+            _, evicted = self.images.popitem(last=False)
+            self.used_bytes -= self.surface_bytes(evicted)
+
+    def add_atlas(self, category, surface, entries):
+        """
+        Registra un atlas ya convertido: cada imagen empaquetada pasa a servirse como subsuperficie
+        con la misma clave que tendría cargada por separado, así image() y frames() la devuelven
+        sin abrir el archivo original.
+        Args:
+            category (str): Nombre del atlas.
+            surface (pygame.Surface): Atlas completo, ya convertido con convert_alpha().
+            entries (iterable): (ruta, escala o None, rectángulo) de cada imagen, como atlas.entries().
+        """
+        self.atlases[category] = memory.track(surface, 'atlas')
+        for path, scale, rect in entries:
+            self.atlas_images[self.key(path, scale)] = surface.subsurface(rect)
+
+    def frames(self, folder, **transform):
+        """
+        Carga los fotogramas numerados (0.png, 1.png, ...) de una carpeta en orden.
+        Args:
+            folder (str): Carpeta con los fotogramas.
+            **transform: Parámetros de transformación que se pasan a image().
+        Returns:
+            list: Superficies compartidas de los fotogramas.
+        """
+        frames = []
+        for folder_path, _, file_names in walk(folder):
+            for file_name in sorted(file_names, key=lambda x: int(x.split('.')[0])):
+                frames.append(self.image(join(folder_path, file_name), **transform))
+        return frames
+
+    def mask(self, surface):
+        # máscara de colisión de una superficie; se crea una vez y vive mientras viva la superficie
+        mask = self.masks.get(surface)
+        if mask is None:
+            mask = self.masks[surface] = pygame.mask.from_surface(surface)
+        return mask
+
+    def silhouette(self, surface):
+        # silueta blanca de la superficie con el negro como transparente, la que muestra un enemigo al morir
+        silhouette = self.silhouettes.get(surface)
+        if silhouette is None:
+            silhouette = self.mask(surface).to_surface()
+            silhouette.set_colorkey('black')
+            memory.track(silhouette, 'transform')
+            self.silhouettes[surface] = silhouette
+        return silhouette
+
+    def sound(self, path):
+        # los sonidos no cuentan para el presupuesto: son pocos y se usan durante toda la partida
+        if path not in self.sounds:
+            self.sounds[path] = pygame.mixer.Sound(path)
+        return self.sounds[path]
+
+    def stats(self):
+        return {
+            'images': len(self.images),
+            'atlas_images': len(self.atlas_images),
+            'atlas_bytes': sum(self.surface_bytes(surface) for surface in self.atlases.values()),
+            'sounds': len(self.sounds),
+            'used_bytes': self.used_bytes,
+            'budget': self.budget,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+assets = AssetCache(ASSET_CACHE_BUDGET)
@@ -0,0 +1,125 @@
+from settings import *
+import json
+import os
+
+ATLAS_VERSION = 1
+ATLAS_FOLDER = join('Resources', 'atlas')
+
+# categoría -> lista de (carpeta de fotogramas numerados o archivo, escala o None)
+ATLAS_SOURCES = {
+    'enemies': [(join('Resources', 'img', 'enemies', folder), None) for folder in ['ghost', 'bat', 'skeleton']],
+    'veronica': [(join('Resources', 'img', 'playerVeronica', state), None) for state in ['left', 'right', 'up', 'down']],
+    'santiago': [(join('Resources', 'img', 'playerSantiago', state), None) for state in ['left', 'right', 'up', 'down']],
+    'drops': [(join('Resources', 'img', 'drop', file_name), (60, 60)) for file_name in ['Health.png', 'Battery.png']],
+}
+
+def source_files(category):
+    """
+    Archivos de imagen de una categoría, con su escala.
+    Returns:
+        list: (ruta, escala o None) en el orden de ATLAS_SOURCES; las carpetas se expanden a sus
+        fotogramas numerados (0.png, 1.png, ...).
+    """
+    files = []
+    for path, scale in ATLAS_SOURCES[category]:
+        if os.path.isdir(path):
+            for file_name in sorted(os.listdir(path), key=lambda x: int(x.split('.')[0])):
+                files.append((join(path, file_name), scale))
+        else:
+            files.append((path, scale))
+    return files
+
+def source_mtime(category):
+    # las carpetas cuentan también, para notar fotogramas añadidos o borrados
+    paths = [path for path, _ in ATLAS_SOURCES[category]] + [path for path, _ in source_files(category)]
+    return max(os.path.getmtime(path) for path in paths)
+
+def atlas_paths(category):
+    return join(ATLAS_FOLDER, f'{category}.png'), join(ATLAS_FOLDER, f'{category}.json')
+
+def pack(sizes, max_width=ATLAS_MAX_WIDTH, padding=1):
+    """
+    Empaquetado por estantes: de la imagen más alta a la más baja, se colocan en filas de
+    izquierda a derecha y se abre una fila nueva cuando no caben en el ancho máximo.
+    Args:
+        sizes (list): (ancho, alto) de cada imagen.
+        max_width (int): Ancho máximo del atlas.
+        padding (int): Separación en píxeles entre imágenes.
+    Returns:
+        tuple: (posiciones (x, y) en el orden de `sizes`, (ancho, alto) del atlas).
+    """
+    positions = [None] * len(sizes)
+    x = y = shelf_height = width = 0
+    for index in sorted(range(len(sizes)), key=lambda i: sizes[i][1], reverse=True):
+        image_width, image_height = sizes[index]
+        if x and x + image_width > max_width:
+            y += shelf_height + padding
+            x = shelf_height = 0
+        positions[index] = (x, y)
+        x += image_width + padding
+        width = max(width, x - padding)
+        shelf_height = max(shelf_height, image_height)
+    return positions, (width, y + shelf_height)
+
+def build(category):
+    """
+    Construye el atlas de una categoría y lo guarda en ATLAS_FOLDER como PNG más un índice JSON
+    con el rectángulo de cada imagen. No necesita ventana: no convierte superficies.
+    Returns:
+        tuple: (superficie del atlas, índice).
+    """
+    files = source_files(category)
+    images = []
+    for path, scale in files:
+        image = pygame.image.load(path)
+        images.append(pygame.transform.scale(image, scale) if scale else image)
+    positions, size = pack([image.get_size() for image in images])
+    surface = pygame.Surface(size, pygame.SRCALPHA, 32)
+    for image, position in zip(images, positions):
+        surface.blit(image, position)
+
+    index = {
+        'version': ATLAS_VERSION,
+        'source_mtime': source_mtime(category),
+        'frames': [
+            {'path': path.replace(os.sep, '/'), 'scale': list(scale) if scale else None, 'rect': [*position, *image.get_size()]}
+            for (path, scale), image, position in zip(files, images, positions)
+        ],
+    }
+    image_path, index_path = atlas_paths(category)
+    os.makedirs(ATLAS_FOLDER, exist_ok=True)
+    pygame.image.save(surface, image_path)
+    with open(index_path + '.tmp', 'w') as f:
+        json.dump(index, f)
+    os.replace(index_path + '.tmp', index_path)
+    return surface, index
+
+def load(category):
+    """
+    Lee el atlas de una categoría, reconstruyéndolo si falta o si alguna imagen de origen cambió.
+    Se puede llamar desde un hilo: devuelve la superficie sin convertir.
+    Returns:
+        tuple: (superficie del atlas, índice).
+    """
+    image_path, index_path = atlas_paths(category)
+    try:
+        with open(index_path) as f:
+            index = json.load(f)
+        if index.get('version') == ATLAS_VERSION and index.get('source_mtime') == source_mtime(category):
+            return pygame.image.load(image_path), index
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, pygame.error) as e:
+        print(f"Atlas {category} no disponible ({e}), reconstruyendo")
+    return build(category)
+
+def entries(index):
+    # (ruta con el separador del sistema, escala, rectángulo) de cada imagen del índice
+    for frame in index['frames']:
+        yield join(*frame['path'].split('/')), tuple(frame['scale']) if frame['scale'] else None, pygame.Rect(frame['rect'])
+
+if __name__ == "__main__":
+    # paso de construcción: genera todos los atlas (el juego también los regenera si están desactualizados)
+    for category in ATLAS_SOURCES:
+        surface, index = build(category)
+        print(f"{category}: {len(index['frames'])} imágenes en {surface.get_width()}x{surface.get_height()}")
@@ -0,0 +1,147 @@
+from settings import *
+from assets import assets
+
+class AudioManager:
+    def __init__(self, groups=AUDIO_CHANNEL_GROUPS):
+        """
+        Sonidos y música del juego, compartidos por todas las partidas y menús del proceso.
+        Cada grupo (disparos, impactos...) tiene sus propios canales reservados del mezclador, así
+        un tiroteo no puede quitarle canales al resto; dentro del grupo cada sonido tiene un máximo
+        de voces simultáneas y un intervalo mínimo entre reproducciones, y lo que los supera se
+        descarta en lugar de mezclarse. La música se carga una sola vez y sigue sonando aunque se
+        vuelvan a crear Game y Menu.
+        Args:
+            groups (dict): Nombre del grupo -> canales reservados para él.
+        Atributos:
+            channels (dict): Nombre del grupo -> sus pygame.mixer.Channel (vacío hasta init()).
+            sounds (dict): Nombre del sonido -> (Sound, grupo, voces máximas, intervalo mínimo en ms).
+            last_played (dict): Nombre del sonido -> get_ticks() de su última reproducción.
+            music_path (str): Archivo de música cargado (None si no hay).
+            played (int): Sonidos reproducidos.
+            throttled (int): Sonidos descartados por repetirse antes de su intervalo mínimo.
+            dropped (int): Sonidos descartados por no tener voz o canal libre.
+        """
+        self.groups = groups
+        self.channels = {}
+        self.sounds = {}
+        self.last_played = {}
+        self.music_path = None
+        self.played = 0
+        self.throttled = 0
+        self.dropped = 0
+
+    def init(self):
+        # reparte los canales entre los grupos; necesita el mezclador ya iniciado
+        if self.channels or not pygame.mixer.get_init():
+            return
+        total = sum(self.groups.values())
+        pygame.mixer.set_num_channels(total + AUDIO_FREE_CHANNELS)
+        # reservados: Sound.play() sin canal explícito no puede ocupar los canales de los grupos,
+        # y los AUDIO_FREE_CHANNELS restantes quedan para los sonidos que no pasan por el gestor
+        pygame.mixer.set_reserved(total)
+        first = 0
+        for group, count in self.groups.items():
+            self.channels[group] = [pygame.mixer.Channel(index) for index in range(first, first + count)]
+            first += count
+
+    def register(self, name, path, group, volume=1.0, voices=1, interval=0):
+        """
+        Registra un sonido para reproducirlo con play(name).
+        Args:
+            name (str): Nombre con el que se reproduce.
+            path (str): Archivo de sonido (se lee de la caché de assets).
+            group (str): Grupo de canales en el que suena.
+            volume (float): Volumen del sonido, de 0 a 1.
+            voices (int): Reproducciones simultáneas máximas de este sonido.
+            interval (int): Milisegundos mínimos entre dos reproducciones.
+        """
+        self.init()
+        try:
+            sound = assets.sound(path)
+        except pygame.error as e:
+            print(f"Error al cargar sonido {path}: {e}")
+            return
+        sound.set_volume(volume)
+        self.sounds[name] = (sound, group, voices, interval)
+
+    def play(self, name):
+        """
+        Reproduce un sonido registrado si su grupo tiene un canal libre y no supera sus límites.
+        Returns:
+            bool: True si se reprodujo.
+        """
+        entry = self.sounds.get(name)
+        channels = self.channels.get(entry[1]) if entry else None
+        if not channels:
+            return False
+        sound, _, voices, interval = entry
+        now = pygame.time.get_ticks()
+        last = self.last_played.get(name)
+        if last is not None and now - last < interval:
+            self.throttled += 1
+            return False
+        free_channel = None
+        playing = 0
+        for channel in channels:
+            if not channel.get_busy():
+                free_channel = free_channel or channel
+            elif channel.get_sound() is sound:
+                playing += 1
+        if playing >= voices or free_channel is None:
+            self.dropped += 1
+            return False
+        free_channel.play(sound)
+        self.last_played[name] = now
+        self.played += 1
+        return True
+
+    def load_music(self, path, volume=1.0):
+        # carga la música solo si es otra: recargar la misma la cortaría
+        if path == self.music_path:
+            return
+        try:
+            pygame.mixer.music.load(path)
+            pygame.mixer.music.set_volume(volume)
+            self.music_path = path
+        except pygame.error as e:
+            print(f"Error al cargar música: {e}")
+
+    def play_music(self, restart=True):
+        """
+        Inicia la música en bucle.
+        Args:
+            restart (bool): Si es False y la música ya está sonando, sigue donde iba.
+        """
+        try:
+            if restart or not pygame.mixer.music.get_busy():
+                pygame.mixer.music.play(loops=-1)
+        except pygame.error as e:
+            print(f"Error al reproducir música: {e}")
+
+    def stop_music(self):
+        try:
+            pygame.mixer.music.stop()
+        except pygame.error as e:
+            print(f"Error al detener música: {e}")
+
+    def pause_music(self):
+        try:
+            pygame.mixer.music.pause()
+        except pygame.error as e:
+            print(f"Error al pausar música: {e}")
+
+    def unpause_music(self):
+        try:
+            pygame.mixer.music.unpause()
+        except pygame.error as e:
+            print(f"Error al reanudar música: {e}")
+
+    def stats(self):
+        return {
+            'played': self.played,
+            'throttled': self.throttled,
+            'dropped': self.dropped,
+        }
+
+
+audio = AudioManager()
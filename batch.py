@@ -0,0 +1,192 @@
+from settings import *
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class EnemyBatch:
+    supported = np is not None
+
+    def __init__(self, collision_rects, world_size, flow_field=None, cell_size=BATCH_CELL_SIZE, capacity=64):
+        """
+        Actualización por lotes de los enemigos con NumPy (opcional: sin NumPy no se usa).
+        El estado que cambia cada paso (posición, velocidad, fotograma, temporizador de muerte) vive en
+        arreglos por columna, uno por atributo y una fila por enemigo. Movimiento, colisiones con el
+        mapa, animación y muerte se calculan para todos a la vez; los sprites solo reciben el rect y
+        la imagen resultantes, que es lo que usan el dibujo y las colisiones con balas y jugador.
+        Las colisiones con el mapa se consultan en una tabla de áreas sumadas de los obstáculos, de
+        modo que saber si un rectángulo toca algún obstáculo cuesta cuatro lecturas.
+        Args:
+            collision_rects (iterable): Rectángulos de los obstáculos, en píxeles.
+            world_size (tuple): Tamaño del mapa en píxeles.
+            flow_field (FlowField): Campo de flujo hacia el jugador, o None para ir en línea recta.
+            cell_size (int): Lado en píxeles de las celdas de la tabla de obstáculos.
+            capacity (int): Filas reservadas al inicio; se duplican cuando hacen falta.
+        Atributos:
+            sprites (list): Enemigo de cada fila, o None si la fila está libre.
+            free_slots (list): Filas libres para reutilizar.
+            obstacles (numpy.ndarray): Tabla de áreas sumadas de las celdas ocupadas por obstáculos.
+        """
+        self.cell_size = cell_size
+        self.flow_field = flow_field
+        self.sprites = []
+        self.free_slots = []
+        self.capacity = 0
+        self.grow(capacity)
+
+        columns = -(-world_size[0] // cell_size)
+        rows = -(-world_size[1] // cell_size)
+        occupied = np.zeros((rows, columns), dtype=np.int32)
+        for rect in collision_rects:
+            occupied[max(0, rect.top // cell_size):max(0, -(-rect.bottom // cell_size)),
+                     max(0, rect.left // cell_size):max(0, -(-rect.right // cell_size))] = 1
+        self.obstacles = np.zeros((rows + 1, columns + 1), dtype=np.int32)
+        self.obstacles[1:, 1:] = occupied.cumsum(0).cumsum(1)
+
+        self.next_tiles_source = None
+        self.next_tiles = None
+        if flow_field:
+            self.tile_centers = np.array([tuple(center) for center in flow_field.centers])
+
+    def grow(self, capacity):
+        # amplía todos los arreglos conservando las filas existentes
+        def resized(array, shape, dtype):
+            new_array = np.zeros(shape, dtype=dtype)
+            if array is not None:
+                new_array[:len(array)] = array
+            return new_array
+
+        old = self.capacity
+        self.active = resized(getattr(self, 'active', None), capacity, bool)
+        self.dead = resized(getattr(self, 'dead', None), capacity, bool)
+        self.solid = resized(getattr(self, 'solid', None), capacity, bool)
+        self.position = resized(getattr(self, 'position', None), (capacity, 2), np.float64)
+        self.size = resized(getattr(self, 'size', None), (capacity, 2), np.float64)
+        self.speed = resized(getattr(self, 'speed', None), capacity, np.float64)
+        self.frame = resized(getattr(self, 'frame', None), capacity, np.float64)
+        self.frame_count = resized(getattr(self, 'frame_count', None), capacity, np.int64)
+        self.animate_speed = resized(getattr(self, 'animate_speed', None), capacity, np.float64)
+        self.shown_frame = resized(getattr(self, 'shown_frame', None), capacity, np.int64)
+        self.death_elapsed = resized(getattr(self, 'death_elapsed', None), capacity, np.float64)
+        self.death_duration = resized(getattr(self, 'death_duration', None), capacity, np.float64)
+        self.sprites.extend([None] * (capacity - old))
+        self.free_slots.extend(range(capacity - 1, old - 1, -1))
+        self.capacity = capacity
+
+    def add(self, enemy):
+        """
+        Registra un enemigo recién creado y copia su estado inicial a una fila libre.
+        Returns:
+            int: Fila asignada al enemigo.
+        """
+        if not self.free_slots:
+            self.grow(self.capacity * 2)
+        slot = self.free_slots.pop()
+        self.sprites[slot] = enemy
+        self.active[slot] = True
+        self.dead[slot] = False
+        self.solid[slot] = enemy.enemy_type != 'ghost'
+        self.position[slot] = enemy.hitbox_rect.topleft
+        self.size[slot] = enemy.hitbox_rect.size
+        self.speed[slot] = enemy.speed
+        self.frame[slot] = enemy.frame_index
+        self.frame_count[slot] = len(enemy.frames)
+        self.animate_speed[slot] = enemy.animate_speed
+        self.shown_frame[slot] = 0
+        self.death_elapsed[slot] = 0
+        self.death_duration[slot] = enemy.death_duration
+        return slot
+
+    def remove(self, enemy):
+        # libera la fila del enemigo; no hace nada si ya se liberó (kill() puede llamarse dos veces)
+        slot = enemy.batch_slot
+        if self.sprites[slot] is enemy:
+            self.active[slot] = False
+            self.sprites[slot] = None
+            self.free_slots.append(slot)
+
+    def mark_dead(self, slot):
+        # a partir de aquí la fila solo avanza su temporizador de muerte
+        self.dead[slot] = True
+        self.death_elapsed[slot] = 0
+
+    def occupied_cells(self, left, top, width, height):
+        # celdas ocupadas por obstáculos bajo cada rectángulo (cuatro lecturas en la tabla de áreas)
+        rows, columns = self.obstacles.shape
+        x0 = np.clip(np.floor_divide(left, self.cell_size), 0, columns - 1).astype(np.int64)
+        y0 = np.clip(np.floor_divide(top, self.cell_size), 0, rows - 1).astype(np.int64)
+        x1 = np.clip(np.floor_divide(left + width - 1, self.cell_size) + 1, 0, columns - 1).astype(np.int64)
+        y1 = np.clip(np.floor_divide(top + height - 1, self.cell_size) + 1, 0, rows - 1).astype(np.int64)
+        table = self.obstacles
+        return table[y1, x1] - table[y0, x1] - table[y1, x0] + table[y0, x0]
+
+    def directions(self, slots, centers, target):
+        # dirección unitaria por fila: campo de flujo para los sólidos con camino, línea recta para el resto
+        direction = np.asarray(target, dtype=np.float64) - centers
+        flow = self.flow_field
+        if flow:
+            if self.next_tiles_source is not flow.next_tiles:
+                self.next_tiles_source = flow.next_tiles
+                self.next_tiles = np.array(flow.next_tiles, dtype=np.int64)
+            tiles = np.floor_divide(centers, flow.tile_size).astype(np.int64)
+            inside = (tiles[:, 0] >= 0) & (tiles[:, 0] < flow.width) & (tiles[:, 1] >= 0) & (tiles[:, 1] < flow.height)
+            next_tiles = np.full(len(slots), -1, dtype=np.int64)
+            next_tiles[inside] = self.next_tiles[tiles[inside, 1] * flow.width + tiles[inside, 0]]
+            use_flow = self.solid[slots] & (next_tiles >= 0)
+            direction[use_flow] = self.tile_centers[next_tiles[use_flow]] - centers[use_flow]
+        length = np.hypot(direction[:, 0], direction[:, 1])
+        moving = length > 0
+        direction[moving] /= length[moving, None]
+        direction[~moving] = 0
+        return direction
+
+    def update(self, dt, target):
+        """
+        Avanza un paso de todos los enemigos del lote y sincroniza sus sprites.
+        Cada eje se mueve por separado; si el rectángulo nuevo se mete en un obstáculo, ese eje no
+        avanza y el enemigo se desliza por el otro. Los fantasmas atraviesan los obstáculos.
+        Args:
+            dt (float): Duración del paso en segundos.
+            target (tuple): Centro del jugador, en píxeles.
+        """
+        alive = np.flatnonzero(self.active & ~self.dead)
+        if len(alive):
+            position = self.position[alive]
+            size = self.size[alive]
+            solid = self.solid[alive]
+            step = self.directions(alive, position + size / 2, target) * (self.speed[alive] * dt)[:, None]
+
+            rounded = np.round(position)
+            overlap = self.occupied_cells(rounded[:, 0], rounded[:, 1], size[:, 0], size[:, 1])
+            for axis in (0, 1):
+                moved = position.copy()
+                moved[:, axis] += step[:, axis]
+                rounded = np.round(moved)
+                moved_overlap = self.occupied_cells(rounded[:, 0], rounded[:, 1], size[:, 0], size[:, 1])
+                # se bloquea el paso que mete al enemigo más en un obstáculo; si apareció encima de uno, puede salir
+                blocked = solid & (moved_overlap > overlap)
+                position[~blocked, axis] = moved[~blocked, axis]
+                overlap = np.where(blocked, overlap, moved_overlap)
+            self.position[alive] = position
+
+            self.frame[alive] += self.animate_speed[alive] * dt
+            frame_index = self.frame[alive].astype(np.int64) % self.frame_count[alive]
+            changed = frame_index != self.shown_frame[alive]
+            self.shown_frame[alive] = frame_index
+
+            sprites = self.sprites
+            rounded = np.round(position).astype(np.int64).tolist()
+            for slot, (x, y), new_frame, index in zip(alive.tolist(), rounded, changed.tolist(), frame_index.tolist()):
+                enemy = sprites[slot]
+                enemy.hitbox_rect.topleft = (x, y)
+                enemy.rect.center = enemy.hitbox_rect.center
+                if new_frame:
+                    enemy.image = enemy.frames[index]
+                    enemy.mask = enemy.masks[index]
+
+        dying = np.flatnonzero(self.active & self.dead)
+        if len(dying):
+            self.death_elapsed[dying] += dt * 1000
+            for slot in dying[self.death_elapsed[dying] >= self.death_duration[dying]].tolist():
+                self.sprites[slot].kill()
@@ -0,0 +1,148 @@
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import json
+import math
+import random
+import pygame
+from settings import *
+import controls
+from profiler import FrameProfiler
+
+class ScriptedInput:
+    def __init__(self, seconds_per_lap=4.0):
+        """
+        Entrada de prueba para el modo sin ventana: el jugador recorre un cuadrado,
+        apunta girando alrededor del centro de la pantalla y dispara sin parar.
+        Args:
+            seconds_per_lap (float): Segundos de simulación para completar una vuelta.
+        """
+        self.seconds_per_lap = seconds_per_lap
+        self.time = 0.0
+        self.directions = [(1, 0), (0, 1), (-1, 0), (0, -1)]
+
+    def advance(self, dt):
+        self.time += dt
+
+    def movement(self):
+        side = int(self.time / self.seconds_per_lap * 4) % 4
+        return self.directions[side]
+
+    def aim_position(self):
+        angle = self.time * 2
+        return (WINDOW_WIDTH / 2 + math.cos(angle) * 200, WINDOW_HEIGHT / 2 + math.sin(angle) * 200)
+
+    def shooting(self):
+        return True
+
+def run_benchmark(enemies=15, ticks=600, seed=0, character='veronica', batch=ENEMY_BATCH):
+    """
+    Construye el mundo sin ventana ni audio y ejecuta `ticks` fotogramas con Game.update y
+    Game.draw, un paso fijo por fotograma. Mantiene `enemies` enemigos activos con spawn_enemies
+    y toma los tiempos de cada fase del FrameProfiler de la partida.
+    Args:
+        enemies (int): Número de enemigos que se mantienen activos.
+        ticks (int): Número de pasos de simulación (cada uno con su dibujo).
+        seed (int): Semilla de random para que las corridas sean comparables.
+        character (str): Personaje del jugador.
+        batch (bool): Mueve a los enemigos con EnemyBatch (NumPy) en lugar de uno por uno.
+    Returns:
+        dict: Tiempos por fase en milisegundos (media y p95), FPS y contadores finales.
+    """
+    import main
+
+    random.seed(seed)
+    pygame.init()
+    script = ScriptedInput()
+    controls.set_script(script)
+
+    main.ENEMY_BATCH = batch
+    game = main.Game()
+    game.selected_character = character
+    game.reset_game()
+    game.game_active = True
+    game.countdown_active = False
+    game.player.countdown_active = False
+    game.player.reset_flashlight()
+    # sin oleadas: la carga la fijan solo los enemigos que se reponen en el bucle
+    game.spawner = None
+    enemy_types = ['ghost', 'bat', 'skeleton']
+    game.max_enemies_per_type = math.ceil(enemies / len(enemy_types))
+
+    # una ventana del perfilador tan larga como la corrida, para medir todos los fotogramas
+    game.profiler = FrameProfiler(window=ticks, trace_frames=1)
+    game.profiler.toggle()
+    spawned = 0
+    for _ in range(ticks):
+        pygame.event.pump()
+        script.advance(FIXED_DT)
+        while sum(game.enemies_active.values()) < enemies:
+            game.spawn_enemies(enemy_types[spawned % len(enemy_types)], random.choice(game.spawn_positions))
+            spawned += 1
+
+        game.profiler.begin_frame()
+        game.update(FIXED_DT)
+        game.draw(1.0)
+        game.profiler.end_frame()
+
+    controls.set_script(None)
+    history = game.profiler.history
+    frame_times = sorted(frame_time for frame_time, _ in history)
+    timings = {}
+    for _, frame_phases in history:
+        for phase in frame_phases:
+            timings.setdefault(phase, [])
+    for phase, values in timings.items():
+        values.extend(sorted(frame_phases.get(phase, 0.0) for _, frame_phases in history))
+    total = sum(frame_times)
+    return {
+        'enemies': enemies,
+        'batch': game.enemy_batch is not None,
+        'ticks': ticks,
+        'fps': ticks / total if total else 0.0,
+        'frame_ms': {'mean': 1000 * total / ticks, 'p95': 1000 * FrameProfiler.percentile(frame_times, 0.95)},
+        'phases_ms': {
+            phase: {'mean': 1000 * sum(values) / ticks, 'p95': 1000 * FrameProfiler.percentile(values, 0.95)}
+            for phase, values in timings.items()
+        },
+        'active_enemies': sum(game.enemies_active.values()),
+        'bullets': len(game.bullet_sprites),
+        'sprites': len(game.all_sprites),
+        'pools': {name: pool.stats() for name, pool in [('bullet', game.bullet_pool), ('enemy', game.enemy_pool), ('drop', game.drop_pool)]},
+        'memory': main.memory.report()[0],
+    }
+
+def print_report(result):
+    print(f"Enemigos: {result['enemies']}  Lote: {'sí' if result['batch'] else 'no'}  Ticks: {result['ticks']}  FPS: {result['fps']:.1f}")
+    print(f"{'fase':<18}{'media ms':>10}{'p95 ms':>10}")
+    for phase, values in result['phases_ms'].items():
+        print(f"{phase:<18}{values['mean']:>10.3f}{values['p95']:>10.3f}")
+    print(f"{'fotograma':<18}{result['frame_ms']['mean']:>10.3f}{result['frame_ms']['p95']:>10.3f}")
+    print(f"Activos al final: enemigos={result['active_enemies']} balas={result['bullets']} sprites={result['sprites']}")
+    for name, stats in result['pools'].items():
+        print(f"Pool {name}: libres={stats['size']} creados={stats['created']} reutilizados={stats['reused']} acierto={stats['hit_rate']:.0%}")
+    print(f"Memoria: {result['memory']}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulación sin ventana del juego con tiempos por fase.")
+    parser.add_argument('--enemies', type=int, nargs='+', default=[15], help="enemigos activos; varios valores miden el escalado")
+    parser.add_argument('--ticks', type=int, default=600, help="pasos de simulación por corrida")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--character', default='veronica', choices=['veronica', 'santiago'])
+    parser.add_argument('--batch', action=argparse.BooleanOptionalAction, default=ENEMY_BATCH,
+                        help="mueve a los enemigos con EnemyBatch (NumPy) en lugar de uno por uno")
+    parser.add_argument('--json', help="ruta donde guardar los resultados en JSON")
+    args = parser.parse_args()
+
+    results = []
+    for enemies in args.enemies:
+        result = run_benchmark(enemies, args.ticks, args.seed, args.character, args.batch)
+        print_report(result)
+        print()
+        results.append(result)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=4)
+    pygame.quit()
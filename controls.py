@@ -0,0 +1,30 @@
+from settings import *
+
+# Fuente de entrada alternativa (por ejemplo, un guion de pruebas). Debe tener los métodos
+# movement(), aim_position() y shooting(); con None se leen el teclado y el ratón.
+script = None
+
+def set_script(new_script):
+    global script
+    script = new_script
+
+def movement():
+    # dirección de movimiento sin normalizar (-1, 0 o 1 en cada eje)
+    if script:
+        return pygame.Vector2(script.movement())
+    keys = pygame.key.get_pressed()
+    return pygame.Vector2(
+        int(keys[pygame.K_RIGHT] or keys[pygame.K_d]) - int(keys[pygame.K_LEFT] or keys[pygame.K_a]),
+        int(keys[pygame.K_DOWN] or keys[pygame.K_s]) - int(keys[pygame.K_UP] or keys[pygame.K_w])
+    )
+
+def aim_position():
+    # posición en pantalla hacia la que apunta el arma
+    if script:
+        return script.aim_position()
+    return pygame.mouse.get_pos()
+
+def shooting():
+    if script:
+        return script.shooting()
+    return pygame.mouse.get_pressed()[0]
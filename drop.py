@@ -1,5 +1,6 @@
 import pygame
 from settings import *
+from assets import assets
 
 class Drop(pygame.sprite.Sprite):
     def __init__(self, pos, groups, drop_type):
@@ -9,17 +10,29 @@ class Drop(pygame.sprite.Sprite):
             pos (tuple): Posición inicial del drop (x, y).
             groups (iterable): Grupos de sprites a los que pertenece.
             drop_type (str): Tipo de drop ('health' o 'battery').
+        Atributos:
+            pool (SpritePool): Pool al que vuelve el drop con kill(), o None.
         """
-        super().__init__(groups)
+        super().__init__()
+        self.pool = None
+        self.spawn(pos, groups, drop_type)
+
+    def spawn(self, pos, groups, drop_type):
+        # estado de cada drop; el pool lo llama de nuevo al reutilizarlo
         self.drop_type = drop_type
         if drop_type == 'health':
-            self.image = pygame.image.load(join('Resources', 'img', 'drop', 'Health.png')).convert_alpha()
+            self.image = assets.image(join('Resources', 'img', 'drop', 'Health.png'), scale=(60, 60))
         elif drop_type == 'battery':
-            self.image = pygame.image.load(join('Resources', 'img', 'drop', 'Battery.png')).convert_alpha()
-        
-        self.image = pygame.transform.scale(self.image, (60, 60))
+            self.image = assets.image(join('Resources', 'img', 'drop', 'Battery.png'), scale=(60, 60))
         
         self.rect = self.image.get_rect(center=pos)
+        self.add(groups)
+
+    def kill(self):
+        if self.alive():
+            super().kill()
+            if self.pool:
+                self.pool.release(self)
     
     def update(self, *args):
         """
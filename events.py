@@ -0,0 +1,71 @@
+from settings import *
+
+class EventDispatcher:
+    def __init__(self):
+        """
+        Tabla de manejadores de eventos por (estado, tipo de evento, tecla).
+        Cada pantalla (menú, pausa, partida...) registra sus manejadores con bind() y en cada
+        fotograma llama a dispatch() con su estado; cada evento se resuelve con una o dos
+        búsquedas en el diccionario, sin recorrer cadenas de if, por muchas pantallas y teclas
+        que haya. Los tipos de evento que nadie escucha se bloquean en SDL con install(), así
+        ni siquiera entran en la cola.
+        Atributos:
+            handlers (dict): (estado, tipo, tecla o None) -> manejador. Con tecla None el manejador
+                             recibe los eventos de ese tipo que no tienen uno propio para su tecla.
+            allowed (set): Tipos de evento que deben llegar a la cola.
+        """
+        self.handlers = {}
+        self.allowed = set()
+
+    def bind(self, state, event_type, handler, keys=(None,)):
+        """
+        Registra un manejador.
+        Args:
+            state (str): Estado en el que se atiende el evento.
+            event_type (int): Tipo de evento de pygame (pygame.KEYDOWN, pygame.QUIT...).
+            handler (callable): Recibe el evento; si devuelve algo distinto de None, dispatch()
+                                deja de procesar y devuelve ese valor.
+            keys (tuple): Teclas a las que responde (None = cualquier tecla o eventos sin tecla).
+        """
+        for key in keys:
+            self.handlers[(state, event_type, key)] = handler
+        self.allowed.add(event_type)
+
+    def allow(self, *event_types):
+        # tipos de evento que deben llegar a la cola aunque no tengan manejador (p. ej. TEXTINPUT,
+        # del que pygame saca el `unicode` de los KEYDOWN)
+        self.allowed.update(event_types)
+
+    def install(self):
+        # bloquea en SDL todos los tipos de evento salvo los registrados
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(self.allowed))
+
+    def dispatch(self, state):
+        """
+        Vacía la cola de eventos y pasa cada uno a su manejador en el estado dado.
+        Si `state` es una función se vuelve a consultar antes de cada evento, así los eventos que
+        siguen a un cambio de pantalla en la misma cola llegan a los manejadores de la nueva.
+        Args:
+            state (str | callable): Estado actual de la pantalla, o función que lo devuelve.
+        Returns:
+            El primer valor distinto de None que devuelva un manejador (los eventos restantes se
+            descartan), o None.
+        """
+        handlers = self.handlers
+        current_state = state
+        for event in pygame.event.get():
+            if callable(state):
+                current_state = state()
+            handler = handlers.get((current_state, event.type, getattr(event, 'key', None)))
+            if handler is None:
+                handler = handlers.get((current_state, event.type, None))
+            if handler is not None:
+                result = handler(event)
+                if result is not None:
+                    return result
+        return None
+
+
+events = EventDispatcher()
+events.allow(pygame.TEXTINPUT)
@@ -0,0 +1,122 @@
+from settings import *
+from memory import memory
+import math
+import random
+
+class Fog:
+    def __init__(self, scale=FOG_SCALE, noise=FOG_NOISE, seed=0):
+        """
+        Niebla que se desplaza sobre la pantalla y aparece y desaparece por ciclos.
+        La textura se guarda ya repetida en 2x2 y a resolución de pantalla, de modo que el
+        desplazamiento se resuelve con un único blit de una ventana de la textura. El ruido puede
+        generarse a menor resolución y se escala una sola vez al crearla; cuando la niebla está
+        inactiva no se dibuja nada.
+        Args:
+            scale (int): Divisor de resolución con el que se genera el ruido (1 = resolución de pantalla).
+            noise (bool): Usa una textura de ruido suave en lugar de un gris plano.
+            seed (int): Semilla del ruido.
+        Atributos:
+            base_alpha (int): Nivel base de transparencia de la niebla.
+            alpha_variation (int): Variación en la transparencia de la niebla.
+            alpha_speed (float): Velocidad de cambio de transparencia de la niebla.
+            offset (pygame.Vector2): Desplazamiento de la niebla en píxeles de pantalla.
+            scroll_speed (pygame.Vector2): Velocidad de desplazamiento de la niebla.
+            active (bool): Indica si la niebla está activa.
+            active_duration (float): Duración en segundos de la niebla activa.
+            inactive_duration (float): Duración en segundos de la niebla inactiva.
+            timer (float): Temporizador para controlar la niebla.
+            alpha (int): Transparencia actual; 0 mientras la niebla está inactiva.
+        """
+        self.base_alpha = 75
+        self.alpha_variation = 25
+        self.alpha_speed = 1.0
+        self.scroll_speed = pygame.Vector2(20, -10)
+        self.active_duration = 5.0
+        self.inactive_duration = 3.0
+
+        self.scale = scale
+        self.tile_width = math.ceil(WINDOW_WIDTH / scale)
+        self.tile_height = math.ceil(WINDOW_HEIGHT / scale)
+
+        tile = self.noise_tile(seed) if noise else self.flat_tile()
+        if scale > 1:
+            # el ruido se genera a baja resolución y se escala una sola vez a pantalla completa
+            self.tile_width *= scale
+            self.tile_height *= scale
+            tile = pygame.transform.scale(tile, (self.tile_width, self.tile_height))
+        self.period = (self.tile_width, self.tile_height)
+        self.texture = pygame.Surface((self.tile_width * 2, self.tile_height * 2)).convert()
+        for x in (0, self.tile_width):
+            for y in (0, self.tile_height):
+                self.texture.blit(tile, (x, y))
+        memory.track(self.texture, 'fog')
+        self.reset()
+
+    def reset(self):
+        self.offset = pygame.Vector2(0, 0)
+        self.active = True
+        self.timer = 0.0
+        self.alpha = 0
+
+    def flat_tile(self):
+        tile = pygame.Surface((self.tile_width, self.tile_height)).convert()
+        tile.fill((200, 200, 200))
+        return tile
+
+    def noise_tile(self, seed):
+        """
+        Genera una textura de ruido de valor suave que se repite sin costuras.
+        Cada octava es una rejilla pequeña de grises aleatorios con una fila y una columna extra
+        que repiten la primera; al ampliarla con smoothscale los bordes opuestos coinciden.
+        Las octavas se suman con BLEND_ADD sobre un gris base.
+        Args:
+            seed (int): Semilla del generador aleatorio.
+        Returns:
+            pygame.Surface: Textura de tamaño (tile_width, tile_height).
+        """
+        rng = random.Random(seed)
+        low, high = 150, 235
+        tile = pygame.Surface((self.tile_width, self.tile_height)).convert()
+        tile.fill((low, low, low))
+        for cells, amplitude in [(4, 0.5), (8, 0.3), (16, 0.2)]:
+            grid_width, grid_height = cells, max(1, round(cells * self.tile_height / self.tile_width))
+            values = [[int(rng.random() * amplitude * (high - low)) for _ in range(grid_height)] for _ in range(grid_width)]
+            grid = pygame.Surface((grid_width + 1, grid_height + 1)).convert()
+            for x in range(grid_width + 1):
+                for y in range(grid_height + 1):
+                    value = values[x % grid_width][y % grid_height]
+                    grid.set_at((x, y), (value, value, value))
+            smooth = pygame.transform.smoothscale(grid, (self.tile_width, self.tile_height))
+            tile.blit(smooth, (0, 0), special_flags=pygame.BLEND_ADD)
+        return tile
+
+    def update(self, dt):
+        self.timer += dt
+        if self.active:
+            if self.timer >= self.active_duration:
+                self.active = False
+                self.timer = 0.0
+        else:
+            if self.timer >= self.inactive_duration:
+                self.active = True
+                self.timer = 0.0
+        self.offset += self.scroll_speed * dt
+        self.offset.x %= self.period[0]
+        self.offset.y %= self.period[1]
+        if self.active:
+            self.alpha = int(self.base_alpha + self.alpha_variation * math.sin(
+                pygame.time.get_ticks() / 1000.0 * self.alpha_speed
+            ))
+        else:
+            self.alpha = 0
+
+    def draw(self, surface):
+        """
+        Dibuja la niebla sobre la superficie con un único blit, o nada si está inactiva.
+        Args:
+            surface (pygame.Surface): Superficie destino (normalmente la pantalla).
+        """
+        if self.alpha <= 0:
+            return
+        self.texture.set_alpha(self.alpha)
+        surface.blit(self.texture, (0, 0), (self.tile_width - int(self.offset.x), self.tile_height - int(self.offset.y), self.tile_width, self.tile_height))
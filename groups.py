@@ -1,4 +1,6 @@
 from settings import *
+from spatial import SpatialHash
+from memory import memory
 
 class AllSprites(pygame.sprite.Group):
     def __init__(self):
@@ -8,24 +10,119 @@ class AllSprites(pygame.sprite.Group):
         super().__init__()
         self.display_surface = pygame.display.get_surface()  # Superficie donde se dibujan los sprites
         self.offset = pygame.Vector2()  # Offset para centrar la cámara en el objetivo
-        
-    def draw(self, target_position):
+        self.camera_rect = pygame.Rect(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)  # Área visible en coordenadas del mundo
+        self.ground_chunks = {}  # (columna, fila) -> superficie con el suelo pre-dibujado
+        self.chunk_pixels = CHUNK_SIZE * TILE_SIZE
+        self.previous_positions = {}  # sprite -> topleft antes del último paso de simulación
+
+    def store_previous(self):
+        # guarda la posición de cada sprite antes de un paso fijo para poder interpolar al dibujar
+        self.previous_positions = {sprite: sprite.rect.topleft for sprite in self}
+
+    def remove_internal(self, sprite):
+        # un sprite del pool puede volver en otra posición antes del siguiente paso: no se interpola desde la vieja
+        self.previous_positions.pop(sprite, None)
+        super().remove_internal(sprite)
+
+    def interpolated_topleft(self, sprite, interpolation):
+        # posición entre la anterior y la actual según la fracción del paso (1.0 = posición actual)
+        previous = self.previous_positions.get(sprite)
+        if previous is None or interpolation >= 1:
+            return pygame.Vector2(sprite.rect.topleft)
+        return pygame.Vector2(previous).lerp(sprite.rect.topleft, interpolation)
+
+    def bake_ground(self):
+        """
+        Pre-dibuja los sprites de suelo del grupo en bloques de CHUNK_SIZE x CHUNK_SIZE tiles.
+        Los sprites de suelo se retiran del grupo, de modo que ni update() ni draw() los recorren
+        en cada fotograma; a partir de aquí el suelo se dibuja blitteando solo los bloques visibles.
+        """
+        self.ground_chunks = {}
+        ground_sprites = [sprite for sprite in self if hasattr(sprite, 'ground')]
+        for sprite in ground_sprites:
+            chunk_key = (sprite.rect.x // self.chunk_pixels, sprite.rect.y // self.chunk_pixels)
+            if chunk_key not in self.ground_chunks:
+                chunk = pygame.Surface((self.chunk_pixels, self.chunk_pixels)).convert()
+                chunk.fill('black')
+                memory.track(chunk, 'ground')
+                self.ground_chunks[chunk_key] = chunk
+            chunk_origin = (chunk_key[0] * self.chunk_pixels, chunk_key[1] * self.chunk_pixels)
+            self.ground_chunks[chunk_key].blit(sprite.image, (sprite.rect.x - chunk_origin[0], sprite.rect.y - chunk_origin[1]))
+        self.remove(ground_sprites)
+
+    def draw_ground_chunks(self):
+        # dibuja solo los bloques de suelo que intersectan la cámara
+        first_col = self.camera_rect.left // self.chunk_pixels
+        last_col = (self.camera_rect.right - 1) // self.chunk_pixels
+        first_row = self.camera_rect.top // self.chunk_pixels
+        last_row = (self.camera_rect.bottom - 1) // self.chunk_pixels
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                chunk = self.ground_chunks.get((col, row))
+                if chunk:
+                    self.display_surface.blit(chunk, (col * self.chunk_pixels + self.offset.x, row * self.chunk_pixels + self.offset.y))
+
+    def draw(self, target_position, interpolation=1.0, target_sprite=None):
         """
         Dibuja todos los sprites del grupo aplicando un offset para centrar la vista en la posición objetivo.
         Separa los sprites en dos capas: suelo y objetos, y los dibuja en orden de profundidad (eje Y).
+        Solo se dibujan los sprites que intersectan la cámara; si el suelo fue pre-dibujado con
+        bake_ground(), se blittean únicamente los bloques visibles.
         Args:
             target_position (tuple): Posición (x, y) del objetivo a centrar (usualmente el jugador).
+            interpolation (float): Fracción (0-1) del paso de simulación para dibujar los sprites
+                                   entre su posición anterior y la actual.
+            target_sprite (pygame.sprite.Sprite, opcional): Sprite objetivo; si se indica, la cámara
+                                   sigue su posición interpolada en lugar de `target_position`.
         """
+        if target_sprite is not None:
+            target_position = self.interpolated_topleft(target_sprite, interpolation) + pygame.Vector2(target_sprite.rect.size) / 2
+
         # Calcular el offset para centrar la cámara en el objetivo
         self.offset.x = -(target_position[0] - WINDOW_WIDTH / 2)
         self.offset.y = -(target_position[1] - WINDOW_HEIGHT / 2)
-        
-        # Separar sprites de suelo y objetos según el atributo 'ground'
-        ground_sprites = [sprite for sprite in self if hasattr(sprite, 'ground')]
-        object_sprites = [sprite for sprite in self if not hasattr(sprite, 'ground')]
-        
+        self.camera_rect.topleft = (int(-self.offset.x), int(-self.offset.y))
+
+        if self.ground_chunks:
+            self.draw_ground_chunks()
+
+        # Separar sprites visibles de suelo y objetos según el atributo 'ground'
+        visible_sprites = [sprite for sprite in self if self.camera_rect.colliderect(sprite.rect)]
+        ground_sprites = [sprite for sprite in visible_sprites if hasattr(sprite, 'ground')]
+        object_sprites = [sprite for sprite in visible_sprites if not hasattr(sprite, 'ground')]
+
         # Dibujar primero el suelo y luego los objetos, ordenados por la coordenada Y (profundidad)
-        for layer in [ground_sprites, object_sprites]:            
+        for layer in [ground_sprites, object_sprites]:
             for sprite in sorted(layer, key=lambda sprite: sprite.rect.centery):
-                self.display_surface.blit(sprite.image, sprite.rect.topleft + self.offset)  # Dibujar sprite con offset
-    
\ No newline at end of file
+                self.display_surface.blit(sprite.image, self.interpolated_topleft(sprite, interpolation) + self.offset)  # Dibujar sprite con offset
+
+
+class CollisionSprites(pygame.sprite.Group):
+    def __init__(self):
+        """
+        Grupo de obstáculos estáticos con un índice espacial por tiles.
+        Tras poblarlo se llama a build_index() y los sprites que se mueven consultan con nearby()
+        solo los obstáculos cercanos a su hitbox en lugar de recorrer el grupo completo.
+        """
+        super().__init__()
+        self.index = SpatialHash(TILE_SIZE)
+
+    def build_index(self):
+        # construye el índice a partir de los obstáculos actuales del grupo
+        self.index.clear()
+        for sprite in self:
+            self.index.insert(sprite)
+
+    def nearby(self, rect):
+        """
+        Devuelve los obstáculos que podrían colisionar con el rectángulo dado.
+        Args:
+            rect (pygame.Rect): Hitbox a consultar en coordenadas del mundo.
+        Returns:
+            list: Obstáculos de las celdas que cubre el rectángulo.
+        """
+        return self.index.query(rect)
+
+    def empty(self):
+        super().empty()
+        self.index.clear()
@@ -0,0 +1,114 @@
+from settings import *
+from collections import OrderedDict
+from memory import memory
+
+class TextCache:
+    def __init__(self, size=TEXT_CACHE_SIZE):
+        """
+        Textos ya renderizados, por fuente, cadena y color. font.render() es de lo más lento que
+        se hace en un fotograma; con la caché un texto que no cambia se renderiza una sola vez.
+        Args:
+            size (int): Textos que se guardan como máximo; al superarlo se descarta el menos usado (LRU).
+        Atributos:
+            surfaces (OrderedDict): (fuente, texto, color) -> Surface, de menos a más usado recientemente.
+            hits (int): Textos servidos desde la caché.
+            misses (int): Textos que hubo que renderizar.
+        """
+        self.size = size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color=(255, 255, 255)):
+        """
+        Devuelve el texto renderizado con antialiasing; la superficie es compartida y no debe modificarse.
+        Args:
+            font (pygame.font.Font): Fuente.
+            text (str): Texto.
+            color (tuple): Color del texto.
+        Returns:
+            pygame.Surface: Texto renderizado.
+        """
+        key = (font, text, tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = self.surfaces[key] = memory.track(font.render(text, True, color), 'text')
+        if len(self.surfaces) > self.size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+
+text_cache = TextCache()
+
+
+class Hud:
+    def __init__(self, size):
+        """
+        Capa del HUD en modo retenido: los widgets (barras y textos) se componen en una superficie
+        propia y cada uno se vuelve a dibujar solo cuando cambia su valor; en cada fotograma la
+        capa se pega a la pantalla con una sola llamada a blits().
+        Args:
+            size (tuple): Tamaño (ancho, alto) de la capa, anclada en la esquina superior izquierda.
+        Atributos:
+            surface (pygame.Surface): Capa con transparencia donde se componen los widgets.
+            values (dict): Nombre del widget -> valor con el que se dibujó por última vez.
+            areas (dict): Nombre del widget -> rectángulo que ocupa en la capa, para borrarlo al cambiar.
+            redraws (int): Widgets redibujados desde el inicio.
+        """
+        self.surface = memory.track(pygame.Surface(size, pygame.SRCALPHA), 'text')
+        self.values = {}
+        self.areas = {}
+        self.redraws = 0
+
+    def changed(self, name, value):
+        # True si el widget hay que redibujarlo; en ese caso borra lo que ocupaba
+        if self.values.get(name) == value:
+            return False
+        self.values[name] = value
+        area = self.areas.get(name)
+        if area:
+            self.surface.fill((0, 0, 0, 0), area)
+        self.redraws += 1
+        return True
+
+    def bar(self, name, rect, ratio, color, background=(100, 100, 100)):
+        """
+        Barra de progreso horizontal.
+        Args:
+            name (str): Nombre del widget.
+            rect (tuple): Rectángulo (x, y, ancho, alto) de la barra en la capa.
+            ratio (float): Fracción llena, de 0 a 1.
+            color (tuple): Color de la parte llena.
+            background (tuple): Color de la parte vacía.
+        """
+        rect = pygame.Rect(rect)
+        fill_width = int(rect.width * max(0, min(1, ratio)))
+        if not self.changed(name, (fill_width, tuple(color))):
+            return
+        pygame.draw.rect(self.surface, background, rect)
+        pygame.draw.rect(self.surface, color, (rect.x, rect.y, fill_width, rect.height))
+        self.areas[name] = rect
+
+    def text(self, name, position, font, text, color=(255, 255, 255)):
+        """
+        Texto con la esquina superior izquierda en `position`. Se renderiza directamente, sin
+        text_cache: la capa ya evita renderizar un texto que no cambia, y los textos del HUD
+        (puntaje, contadores) cambian tanto que en la caché solo desplazarían a los que se reutilizan.
+        Args:
+            name (str): Nombre del widget.
+            position (tuple): Posición (x, y) en la capa.
+            font (pygame.font.Font): Fuente.
+            text (str): Texto.
+            color (tuple): Color del texto.
+        """
+        if not self.changed(name, (text, tuple(color))):
+            return
+        self.areas[name] = self.surface.blit(font.render(text, True, color), position)
+
+    def draw(self, surface):
+        # una sola llamada que pega de la capa solo las zonas con widgets, no el rectángulo completo
+        surface.blits([(self.surface, area, area) for area in self.areas.values()], doreturn=False)
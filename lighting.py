@@ -0,0 +1,95 @@
+from settings import *
+from collections import OrderedDict
+from memory import memory
+
+class LightMask:
+    def __init__(self, color=(10, 10, 20), alpha=230, falloff=LIGHT_FALLOFF, radius_step=LIGHT_RADIUS_STEP, max_cached=LIGHT_CACHE_SIZE):
+        """
+        Capa de oscuridad a pantalla completa con el círculo de luz de la linterna.
+        La capa se mantiene entre fotogramas y solo se retoca el cuadrado que ocupa el círculo
+        cuando cambia el radio redondeado. Los parches de cada radio se guardan en una caché LRU.
+        Args:
+            color (tuple): Color RGB de la oscuridad.
+            alpha (int): Opacidad de la oscuridad (0-255).
+            falloff (int): Ancho en píxeles del degradado del borde de la luz. 0 dibuja un borde duro.
+            radius_step (int): Paso de redondeo del radio, en píxeles.
+            max_cached (int): Número máximo de parches de radio guardados.
+        Atributos:
+            surface (pygame.Surface): Capa de oscuridad que se blittea sobre la pantalla.
+            patches (OrderedDict): Radio redondeado -> parche con el círculo de luz.
+            hole_rect (pygame.Rect): Zona de la capa ocupada por el parche actual.
+            radius_key (int): Radio redondeado dibujado actualmente en la capa.
+        """
+        self.color = color
+        self.alpha = alpha
+        self.falloff = falloff
+        self.radius_step = radius_step
+        self.max_cached = max_cached
+        self.center = (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2)
+        self.patches = OrderedDict()
+        self.hole_rect = pygame.Rect(self.center, (0, 0))
+        self.radius_key = 0
+
+        # con transparencia por píxel en ambos modos: el blit a pantalla completa es el más barato
+        self.dark_color = (*self.color, self.alpha)
+        self.surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+        self.surface.fill(self.dark_color)
+        memory.track(self.surface, 'light')
+
+    def build_patch(self, radius):
+        """
+        Dibuja el círculo de luz de un radio sobre un cuadrado de oscuridad.
+        Con borde duro el círculo es totalmente transparente; con degradado se dibujan anillos
+        concéntricos cuya opacidad baja de `alpha` en el borde a 0 en el interior.
+        Args:
+            radius (int): Radio del círculo de luz.
+        Returns:
+            pygame.Surface: Parche de tamaño (2 * radius, 2 * radius).
+        """
+        size = 2 * radius
+        patch = pygame.Surface((size, size), pygame.SRCALPHA)
+        patch.fill(self.dark_color)
+        if not self.falloff:
+            pygame.draw.circle(patch, (*self.color, 0), (radius, radius), radius)
+            return patch
+
+        falloff = min(self.falloff, radius)
+        for ring in range(falloff + 1):
+            ring_alpha = int(self.alpha * (falloff - ring) / falloff)
+            pygame.draw.circle(patch, (*self.color, ring_alpha), (radius, radius), radius - ring)
+        return patch
+
+    def get_patch(self, radius_key):
+        patch = self.patches.get(radius_key)
+        if patch is None:
+            patch = memory.track(self.build_patch(radius_key), 'light')
+            self.patches[radius_key] = patch
+            if len(self.patches) > self.max_cached:
+                self.patches.popitem(last=False)
+        else:
+            self.patches.move_to_end(radius_key)
+        return patch
+
+    def set_radius(self, radius):
+        # retoca la capa solo si cambia el radio redondeado
+        radius_key = int(round(radius / self.radius_step) * self.radius_step)
+        if radius_key == self.radius_key:
+            return
+        self.radius_key = radius_key
+        self.surface.fill(self.dark_color, self.hole_rect)
+        if radius_key <= 0:
+            self.hole_rect = pygame.Rect(self.center, (0, 0))
+            return
+        patch = self.get_patch(radius_key)
+        self.hole_rect = patch.get_rect(center=self.center)
+        self.surface.blit(patch, self.hole_rect, special_flags=pygame.BLEND_RGBA_MIN)
+
+    def draw(self, surface, radius):
+        """
+        Dibuja la oscuridad sobre la superficie con el círculo de luz del radio dado.
+        Args:
+            surface (pygame.Surface): Superficie destino (normalmente la pantalla).
+            radius (float): Radio actual de la linterna del jugador.
+        """
+        self.set_radius(radius)
+        surface.blit(self.surface, (0, 0))
@@ -0,0 +1,115 @@
+from settings import *
+from concurrent.futures import ThreadPoolExecutor
+from assets import assets
+import atlas
+
+class AssetLoader:
+    def __init__(self, cache, workers=LOADER_WORKERS):
+        """
+        Carga de imágenes y sonidos en segundo plano hacia la caché compartida de assets.
+        Los hilos leen y decodifican los archivos (y escalan las imágenes); la conversión al
+        formato de la pantalla (convert/convert_alpha) se hace en el hilo principal dentro de
+        poll(), porque necesita el display. Lo ya cargado queda en la caché, así que las llamadas
+        normales a assets.image()/assets.sound() posteriores no vuelven a leer el disco.
+        Las peticiones se acumulan y los hilos empiezan con el primer poll() o wait(), para que no
+        compitan con lo que se carga de forma síncrona antes del primer fotograma (el splash).
+        Args:
+            cache (AssetCache): Caché donde se guardan los resultados.
+            workers (int): Hilos de lectura y decodificación.
+        Atributos:
+            queued (list): (función, argumentos, nombre, cierre) aún sin enviar a los hilos; el cierre
+                           recibe el resultado en el hilo principal y lo guarda en la caché.
+            pending (list): (futuro, nombre, cierre) de las cargas en curso.
+            requested (set): Claves, rutas y atlas ya pedidos, para no pedirlos dos veces.
+            total (int): Cargas pedidas desde el inicio.
+            done (int): Cargas terminadas (con éxito o con error).
+        """
+        self.cache = cache
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='assets')
+        self.queued = []
+        self.pending = []
+        self.requested = set()
+        self.total = 0
+        self.done = 0
+
+    @staticmethod
+    def decode(path, scale):
+        surface = pygame.image.load(path)
+        return pygame.transform.scale(surface, scale) if scale else surface
+
+    def request(self, key, function, args, name, finish):
+        if key in self.requested:
+            return
+        self.requested.add(key)
+        self.queued.append((function, args, name, finish))
+        self.total += 1
+
+    def image(self, path, scale=None, alpha=True):
+        # pide una imagen con la misma clave que usará assets.image(path, scale=scale, alpha=alpha)
+        key = self.cache.key(path, scale, alpha=alpha)
+        if key in self.cache.images or key in self.cache.atlas_images:
+            return
+        finish = lambda surface: self.cache.store(key, surface.convert_alpha() if alpha else surface.convert())
+        self.request(key, self.decode, (path, scale), path, finish)
+
+    def frames(self, folder, scale=None, alpha=True):
+        for folder_path, _, file_names in walk(folder):
+            for file_name in file_names:
+                self.image(join(folder_path, file_name), scale, alpha)
+
+    def sound(self, path):
+        if path in self.cache.sounds:
+            return
+        self.request(path, pygame.mixer.Sound, (path,), path, lambda sound: self.cache.sounds.__setitem__(path, sound))
+
+    def atlas(self, category):
+        # pide un atlas de atlas.py; sus imágenes pasan a servirse como subsuperficies desde la caché
+        if category in self.cache.atlases:
+            return
+        finish = lambda result: self.cache.add_atlas(category, result[0].convert_alpha(), atlas.entries(result[1]))
+        self.request(('atlas', category), atlas.load, (category,), f'atlas {category}', finish)
+
+    def start(self):
+        # envía a los hilos lo acumulado desde la última vez
+        for function, args, name, finish in self.queued:
+            self.pending.append((self.executor.submit(function, *args), name, finish))
+        self.queued = []
+
+    def poll(self):
+        """
+        Recoge las cargas terminadas: convierte las imágenes y los atlas y los guarda en la caché junto a los sonidos.
+        Se llama desde el hilo principal, una vez por fotograma mientras hay cargas pendientes.
+        Returns:
+            float: Progreso de 0 a 1.
+        """
+        self.start()
+        still_pending = []
+        for future, name, finish in self.pending:
+            if not future.done():
+                still_pending.append((future, name, finish))
+                continue
+            self.done += 1
+            try:
+                finish(future.result())
+            except (pygame.error, OSError, ValueError) as e:
+                print(f"Error al cargar {name}: {e}")
+        self.pending = still_pending
+        return self.progress
+
+    def wait(self):
+        # bloquea hasta que termine todo lo pedido (para quien necesita los assets ya)
+        self.start()
+        for future, _, _ in self.pending:
+            future.exception()
+        self.poll()
+
+    @property
+    def progress(self):
+        return self.done / self.total if self.total else 1.0
+
+    @property
+    def finished(self):
+        return not self.pending and not self.queued
+
+
+loader = AssetLoader(assets)
@@ -1,23 +1,41 @@
 from settings import *
 from player import *
 from sprites import *
-from pytmx.util_pygame import load_pygame
-from groups import AllSprites
-from random import randint, choice
+from world import load_world
+from groups import AllSprites, CollisionSprites
+from spatial import BroadPhase
+from pathfinding import FlowField
+from batch import EnemyBatch
+from pool import SpritePool
+from spawner import SpawnScheduler
+from lighting import LightMask
+from fog import Fog
+import controls
+from profiler import FrameProfiler
 from drop import Drop
 from menu import Menu
-import json
+from assets import assets
+from loader import loader
+from scores import ScoreStore
+from hud import Hud, text_cache
+from events import events
+from audio import audio
+from memory import memory
 from datetime import datetime
+import os
 import pygame
-import math
 
 class Game:
-    def __init__(self):
+    def __init__(self, scores=None):
         """
         Inicializa los atributos necesarios para el funcionamiento del juego.
+        Args:
+            scores (ScoreStore, opcional): Historial de puntajes; sin él no se guardan puntajes
+                                           (p. ej. en benchmark.py).
         Atributos:
             display_surface (pygame.Surface): Superficie de la ventana principal del juego.
             clock (pygame.time.Clock): Reloj para controlar la velocidad de fotogramas.
+            accumulator (float): Tiempo real pendiente de simular en pasos fijos de FIXED_DT segundos.
             running (bool): Indica si el juego está en ejecución.
             game_over (bool): Indica si el juego ha terminado.
             game_over_time (int): Tiempo en milisegundos desde que el juego terminó.
@@ -30,29 +48,27 @@ class Game:
             countdown_start_time (int): Tiempo de inicio de la cuenta regresiva.
             countdown_duration (int): Duración en milisegundos de la cuenta regresiva.
             selected_character (str): Nombre del personaje seleccionado.
+            world (WorldTemplate): Plantilla compilada del mapa; se carga en el primer setup().
+            player (Player): Jugador de la partida actual.
+            gun (Gun): Arma del jugador de la partida actual.
             all_sprites (AllSprites): Grupo de todos los sprites del juego.
-            collision_sprites (pygame.sprite.Group): Grupo de sprites para detección de colisiones.
+            collision_sprites (CollisionSprites): Grupo de obstáculos con índice espacial para detección de colisiones.
             bullet_sprites (pygame.sprite.Group): Grupo de sprites de balas.
             enemy_sprites (pygame.sprite.Group): Grupo de sprites de enemigos.
             drop_sprites (pygame.sprite.Group): Grupo de sprites de objetos caídos.
-            light_surface (pygame.Surface): Superficie para efectos de iluminación.
-            fog_surface (pygame.Surface): Superficie para efectos de niebla.
-            fog_base_alpha (int): Nivel base de transparencia de la niebla.
-            fog_alpha_variation (int): Variación en la transparencia de la niebla.
-            fog_alpha_speed (float): Velocidad de cambio de transparencia de la niebla.
-            fog_offset (pygame.Vector2): Desplazamiento de la niebla.
-            fog_scroll_speed (pygame.Vector2): Velocidad de desplazamiento de la niebla.
-            fog_active (bool): Indica si la niebla está activa.
-            fog_active_duration (float): Duración en segundos de la niebla activa.
-            fog_inactive_duration (float): Duración en segundos de la niebla inactiva.
-            fog_timer (float): Temporizador para controlar la niebla.
+            enemy_broad_phase (BroadPhase): Rejilla de enemigos que filtra los pares para las colisiones por máscara.
+            flow_field (FlowField): Campo de flujo hacia el jugador que siguen los enemigos; se crea con el mapa.
+            enemy_batch (EnemyBatch): Lote NumPy que mueve a todos los enemigos, o None sin NumPy o con ENEMY_BATCH apagado.
+            bullet_pool, enemy_pool, drop_pool (SpritePool): Instancias reutilizables de balas, enemigos y drops.
+            profiler (FrameProfiler): Perfilador por fases del bucle (F3 muestra el panel, F4 exporta la traza).
+            light (LightMask): Capa de oscuridad con el círculo de luz de la linterna.
+            fog (Fog): Niebla que se desplaza y aparece por ciclos sobre la pantalla.
             can_shoot (bool): Indica si el jugador puede disparar.
-            shoot_time (int): Tiempo en milisegundos desde el último disparo.
+            sim_time (float): Milisegundos de simulación transcurridos desde el inicio de la partida.
+            shoot_time (int): Tiempo de simulación en milisegundos del último disparo.
             gun_cooldown (int): Tiempo de espera en milisegundos entre disparos.
-            enemy_event (int): Tipo de evento personalizado para generar enemigos.
+            spawner (SpawnScheduler): Planificador de las oleadas de enemigos (None = sin oleadas).
             spawn_positions (list): Lista de posiciones de generación de enemigos.
-            shoot_sound (pygame.mixer.Sound): Sonido de disparo.
-            impact_sound (pygame.mixer.Sound): Sonido de impacto.
             score (int): Puntuación del jugador.
             start_time (int): Tiempo de inicio del juego en milisegundos.
             difficulty_timer (int): Temporizador para aumentar la dificultad.
@@ -60,15 +76,18 @@ class Game:
             difficulty_level (int): Nivel actual de dificultad.
             enemies_defeated (dict): Diccionario con el número de enemigos derrotados por tipo.
             enemies_active (dict): Diccionario con el número de enemigos activos por tipo.
-            max_enemies_per_type (int): Número máximo de enemigos por tipo.
-            score_file (str): Ruta del archivo de puntuaciones.
+            max_enemies_per_type (int): Número máximo de enemigos por tipo en el nivel 0 de dificultad
+                                        (ver enemy_cap()).
+            scores (ScoreStore): Historial de puntajes compartido entre partidas (None = sin guardar).
             font (pygame.font.Font): Fuente para texto general.
             game_over_font (pygame.font.Font): Fuente para texto de "Game Over".
             countdown_font (pygame.font.Font): Fuente para texto de cuenta regresiva.
-            high_scores (dict): Diccionario con las puntuaciones más altas.
+            hud (Hud): Capa retenida con las barras y los textos del HUD.
+            high_scores (list): Las SCORE_TOP puntuaciones más altas.
             player_name (str): Nombre del jugador.
-            game_over_bg (pygame.Surface): Imagen de fondo para la pantalla de "Game Over".
-            pause_bg (pygame.Surface): Imagen de fondo para la pantalla de pausa.
+            assets_ready (bool): Indica si load_assets() ya asignó sonidos, fondos y fotogramas.
+            game_over_bg (pygame.Surface): Imagen de fondo para la pantalla de "Game Over" (en load_assets).
+            pause_bg (pygame.Surface): Imagen de fondo para la pantalla de pausa (en load_assets).
             pause_option_areas (list): Lista de áreas rectangulares para las opciones de pausa.
         Excepciones:
             pygame.error: Se lanza si ocurre un error al cargar sonidos o música.
@@ -77,6 +96,7 @@ class Game:
         self.display_surface = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("Y ahora que...")
         self.clock = pygame.time.Clock()
+        self.accumulator = 0.0
         self.running = True
         self.game_over = False
         self.game_over_time = 0
@@ -92,48 +112,37 @@ class Game:
         self.countdown_duration = 2000
         
         self.selected_character = "veronica"
+        self.world = None
+        self.player = None
+        self.gun = None
         
         self.all_sprites = AllSprites()
-        self.collision_sprites = pygame.sprite.Group()
+        self.collision_sprites = CollisionSprites()
         self.bullet_sprites = pygame.sprite.Group()
         self.enemy_sprites = pygame.sprite.Group()
         self.drop_sprites = pygame.sprite.Group()
+        self.enemy_broad_phase = BroadPhase()
+        self.flow_field = None
+        self.enemy_batch = None
+        self.bullet_pool = SpritePool(Bullet)
+        self.enemy_pool = SpritePool(Enemy)
+        self.drop_pool = SpritePool(Drop)
+        self.profiler = FrameProfiler()
+        for name in ['all_sprites', 'enemy_sprites', 'bullet_sprites', 'drop_sprites']:
+            memory.watch(name, getattr(self, name))
         
-        self.light_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        self.light_surface.fill((10, 10, 20))
-        self.light_surface.set_alpha(230)
+        self.light = LightMask()
         
-        self.fog_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        self.fog_surface.fill((200, 200, 200))
-        self.fog_base_alpha = 75
-        self.fog_alpha_variation = 25
-        self.fog_alpha_speed = 1.0
-        self.fog_offset = pygame.Vector2(0, 0)
-        self.fog_scroll_speed = pygame.Vector2(20, -10)
-        self.fog_active = True
-        self.fog_active_duration = 5.0
-        self.fog_inactive_duration = 3.0
-        self.fog_timer = 0.0
+        self.fog = Fog()
         
+        self.sim_time = 0
         self.can_shoot = True
         self.shoot_time = 0
         self.gun_cooldown = 100
         
-        self.enemy_event = pygame.event.custom_type()
-        pygame.time.set_timer(self.enemy_event, 500)
+        self.spawner = SpawnScheduler()
         self.spawn_positions = []
         
-        try:
-            self.shoot_sound = pygame.mixer.Sound(join('audio', 'shoot.wav'))
-            self.shoot_sound.set_volume(0.2)
-            self.impact_sound = pygame.mixer.Sound(join('audio', 'impact.ogg'))
-            pygame.mixer.music.load(join('audio', 'principal.mp3'))
-            pygame.mixer.music.set_volume(1)
-        except pygame.error as e:
-            print(f"Error al cargar sonidos o soundtrack: {e}")
-            self.shoot_sound = None
-            self.impact_sound = None
-        
         self.score = 0
         self.start_time = pygame.time.get_ticks()
         self.difficulty_timer = 0
@@ -142,108 +151,75 @@ class Game:
         self.enemies_defeated = {'ghost': 0, 'bat': 0, 'skeleton': 0}
         self.enemies_active = {'ghost': 0, 'bat': 0, 'skeleton': 0}
         self.max_enemies_per_type = 5
-        self.score_file = join('Resources', 'scores.json')
+        self.scores = scores
         self.font = pygame.font.Font(None, 36)
         self.game_over_font = pygame.font.Font(None, 72)
         self.countdown_font = pygame.font.Font(None, 120)
-        self.high_scores = self.load_scores()
+        self.hud = Hud((WINDOW_WIDTH // 2, 160))
+        self.high_scores = self.scores.top() if self.scores else []
         self.player_name = ""
         
-        self.game_over_bg = pygame.image.load(join('Resources', 'img', 'GameOver.png')).convert_alpha()
-        self.game_over_bg = pygame.transform.scale(self.game_over_bg, (WINDOW_WIDTH, WINDOW_HEIGHT))
-        
-        self.pause_bg = pygame.image.load(join('Resources', 'img', 'Pause.png')).convert_alpha()
-        self.pause_bg = pygame.transform.scale(self.pause_bg, (WINDOW_WIDTH, WINDOW_HEIGHT))
-        
         self.pause_option_areas = [
             pygame.Rect(WINDOW_WIDTH // 2 - 200, WINDOW_HEIGHT // 2 - 115, 200, 40),
             pygame.Rect(WINDOW_WIDTH // 2 - 200, WINDOW_HEIGHT // 2 + 5, 200, 40),
             pygame.Rect(WINDOW_WIDTH // 2 - 200, WINDOW_HEIGHT // 2 + 120, 200, 40)
         ]
         
-        self.load_images()
+        self.assets_ready = False
+        self.queue_assets()
+        self.bind_events()
         
-    def play_music(self):
-        # inicia el sonido
-        try:
-            pygame.mixer.music.play(loops=-1)
-        except pygame.error as e:
-            print(f"Error al reproducir música: {e}")
-
-    def stop_music(self):
-        # detiene la musica
-        try:
-            pygame.mixer.music.stop()
-        except pygame.error as e:
-            print(f"Error al detener música: {e}")
-
-    def pause_music(self):
-        # pausa la musica
-        try:
-            pygame.mixer.music.pause()
-        except pygame.error as e:
-            print(f"Error al pausar música: {e}")
-
-    def unpause_music(self):
-        # continua la musica
-        try:
-            pygame.mixer.music.unpause()
-        except pygame.error as e:
-            print(f"Error al reanudar música: {e}")
+    def queue_assets(self):
+        # pide en segundo plano todo lo que usa la partida; load_assets() lo recoge antes de la primera ronda
+        loader.sound(join('audio', 'shoot.wav'))
+        loader.sound(join('audio', 'impact.ogg'))
+        loader.image(join('Resources', 'img', 'GameOver.png'), scale=(WINDOW_WIDTH, WINDOW_HEIGHT))
+        loader.image(join('Resources', 'img', 'Pause.png'), scale=(WINDOW_WIDTH, WINDOW_HEIGHT))
+        loader.image(join('Resources', 'img', 'gun', 'bullet.png'))
+        loader.image(join('Resources', 'img', 'gun', 'gun.png'))
+        # fotogramas de enemigos y jugadores y drops ya escalados: un archivo por categoría (ver atlas.py)
+        for category in ['enemies', 'veronica', 'santiago', 'drops']:
+            loader.atlas(category)
 
+    def load_assets(self):
+        """
+        Registra los sonidos y la música en el gestor de audio y asigna fondos y fotogramas de la partida. Se llama al empezar la primera ronda:
+        para entonces la carga en segundo plano de queue_assets() suele haber terminado y todo sale
+        de la caché; si no, espera a que termine.
+        """
+        if self.assets_ready:
+            return
+        loader.wait()
+        audio.register('shoot', join('audio', 'shoot.wav'), 'weapons', volume=0.2, voices=2)
+        audio.register('impact', join('audio', 'impact.ogg'), 'impacts', voices=3, interval=40)
+        audio.load_music(join('audio', 'principal.mp3'))
+        
+        self.game_over_bg = assets.image(join('Resources', 'img', 'GameOver.png'), scale=(WINDOW_WIDTH, WINDOW_HEIGHT))
+        
+        self.pause_bg = assets.image(join('Resources', 'img', 'Pause.png'), scale=(WINDOW_WIDTH, WINDOW_HEIGHT))
+        
+        self.load_images()
+        self.assets_ready = True
+        
     def load_images(self):
-        # carga las imagenes 
-        self.bullet_surface = pygame.image.load(join('Resources', 'img', 'gun', 'bullet.png')).convert_alpha()
+        # carga las imagenes, con sus máscaras de colisión y la silueta de muerte de cada enemigo ya
+        # calculadas, para que no se construyan a mitad de partida
+        self.bullet_surface = assets.image(join('Resources', 'img', 'gun', 'bullet.png'))
+        assets.mask(self.bullet_surface)
         folders = ['ghost', 'bat', 'skeleton']
         self.enemy_frames = {}
+        self.enemy_masks = {}
         for folder in folders:
-            for folder_path, _, file_names in walk(join('Resources', 'img', 'enemies', folder)):
-                self.enemy_frames[folder] = []
-                for file_name in sorted(file_names, key=lambda x: int(x.split('.')[0])):
-                    full_path = join(folder_path, file_name)
-                    surf = pygame.image.load(full_path).convert_alpha()
-                    self.enemy_frames[folder].append(surf)
-
-    def load_scores(self):
-        # carga los puntajes desde el archivo 
-        try:
-            with open(self.score_file, 'r') as f:
-                scores = json.load(f)
-                valid_scores = [
-                    score for score in scores
-                    if isinstance(score, dict) and
-                    'name' in score and 'score' in score and 'date' in score and
-                    isinstance(score['score'], (int, float))
-                ]
-                # print(f"Puntajes cargados: {valid_scores}")
-                return valid_scores
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"Error al cargar puntajes: {e}, inicializando lista vacía")
-            return []
+            self.enemy_frames[folder] = assets.frames(join('Resources', 'img', 'enemies', folder))
+            self.enemy_masks[folder] = [assets.mask(frame) for frame in self.enemy_frames[folder]]
+            assets.silhouette(self.enemy_frames[folder][0])
 
     def save_scores(self):
-        # guarda los puntajes en el archivo 
-        if self.player_name:
-            date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            new_score = {'name': self.player_name, 'score': int(self.score), 'date': date}
-            # print(f"Guardando nuevo puntaje: {new_score}")
-            high_scores = [dict(score) for score in self.high_scores]
-            high_scores.append(new_score)
-            high_scores = sorted(high_scores, key=lambda x: x['score'], reverse=True)
-            unique_scores = []
-            seen_scores = set()
-            for score in high_scores:
-                score_tuple = (score['score'], score['name'], score['date'])
-                if score_tuple not in seen_scores:
-                    unique_scores.append(score)
-                    seen_scores.add(score_tuple)
-                if len(unique_scores) >= 5:
-                    break
-            self.high_scores = unique_scores
-            # print(f"Puntajes después de guardar: {self.high_scores}")
-            with open(self.score_file, 'w') as f:
-                json.dump(self.high_scores, f, indent=4)
-                
+        # registra el puntaje de la partida; el archivo se escribe en segundo plano (ver scores.py)
+        if self.player_name and self.scores:
+            self.scores.add(self.player_name, self.score)
+            self.high_scores = self.scores.top()
+
     def update_score(self, dt, enemy_type=None):
         # actualiza el puntaje en el archivo 
         if not self.countdown_active:
@@ -263,17 +239,20 @@ class Game:
                     self.enemies_active['skeleton'] -= 1
 
     def draw_score(self):
-        # imprime los puntajes y coloca el total de enemigos activos 
-        score_text = self.font.render(f"Puntaje: {int(self.score)}", True, (255, 255, 255))
-        self.display_surface.blit(score_text, (10, 70))
+        # imprime los puntajes y coloca el total de enemigos activos; el HUD solo re-renderiza los textos que cambian
+        self.hud.text('score', (10, 70), self.font, f"Puntaje: {int(self.score)}")
         total_enemies = sum(self.enemies_active.values())
-        debug_text = self.font.render(
+        self.hud.text(
+            'enemies', (10, 100), self.font,
             f"Enemigos activos: G={self.enemies_active['ghost']} "
             f"B={self.enemies_active['bat']} S={self.enemies_active['skeleton']} "
-            f"Total={total_enemies}",
-            True, (255, 255, 255)
+            f"Total={total_enemies}"
+        )
+        self.hud.text(
+            'broad_phase', (10, 130), self.font,
+            f"Pares probados: {self.enemy_broad_phase.pairs_tested} "
+            f"descartados: {self.enemy_broad_phase.pairs_pruned}"
         )
-        self.display_surface.blit(debug_text, (10, 100))
 
     def draw_countdown(self):
         # este es el conteo regresivo para iniciar el juego
@@ -285,8 +264,8 @@ class Game:
             countdown_number = int((remaining_time / 1000) + 1)
             countdown_text = f"¡El juego comienza en {countdown_number}!"
             
-            text_surface = self.countdown_font.render(countdown_text, True, (255, 255, 255))
-            shadow_surface = self.countdown_font.render(countdown_text, True, (0, 0, 0))
+            text_surface = text_cache.render(self.countdown_font, countdown_text, (255, 255, 255))
+            shadow_surface = text_cache.render(self.countdown_font, countdown_text, (0, 0, 0))
             
             text_rect = text_surface.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
             shadow_rect = shadow_surface.get_rect(center=(WINDOW_WIDTH // 2 + 3, WINDOW_HEIGHT // 2 + 3))
@@ -303,7 +282,7 @@ class Game:
     def draw_game_over(self):
         # muestra el game over al finalizar el juego
         self.display_surface.blit(self.game_over_bg, (0, 0))
-        score_text = self.game_over_font.render(f"{int(self.score)}", True, (255, 255, 255))
+        score_text = text_cache.render(self.game_over_font, f"{int(self.score)}")
         score_rect = score_text.get_rect(center=(WINDOW_WIDTH // 2 + 100, WINDOW_HEIGHT // 2 + 5))
         self.display_surface.blit(score_text, score_rect)
         pygame.display.update()
@@ -321,19 +300,17 @@ class Game:
         pygame.draw.polygon(self.display_surface, (255, 255, 0), triangle_points)
 
     def input(self):
-        if pygame.mouse.get_pressed()[0] and self.can_shoot and not self.countdown_active:
-            if self.shoot_sound:
-                self.shoot_sound.play()
+        if controls.shooting() and self.can_shoot and not self.countdown_active:
+            audio.play('shoot')
             position = self.gun.rect.center + self.gun.player_direction * 50
-            Bullet(self.bullet_surface, position, self.gun.player_direction, (self.all_sprites, self.bullet_sprites))
+            self.bullet_pool.acquire(self.bullet_surface, position, self.gun.player_direction, (self.all_sprites, self.bullet_sprites))
             self.can_shoot = False
-            self.shoot_time = pygame.time.get_ticks()
+            self.shoot_time = self.sim_time
        
     def gun_timer(self):
         # configuracion para los disparos
         if not self.can_shoot:
-            current_time = pygame.time.get_ticks()
-            if current_time - self.shoot_time >= self.gun_cooldown:
+            if self.sim_time - self.shoot_time >= self.gun_cooldown:
                 self.can_shoot = True
 
     def update_difficulty(self, dt):
@@ -352,50 +329,70 @@ class Game:
 
     def reset_game(self):
         #reinicio del juego
+        self.load_assets()
         self.score = 0
         self.start_time = pygame.time.get_ticks()
         self.difficulty_timer = 0
         self.difficulty_level = 0
         self.enemies_defeated = {'ghost': 0, 'bat': 0, 'skeleton': 0}
         self.enemies_active = {'ghost': 0, 'bat': 0, 'skeleton': 0}
+        self.spawner.reset()
         self.game_over = False
         self.game_over_time = 0
         self.game_active = False
         self.paused = False
         self.pause_selected_option = 0
-        self.fog_offset = pygame.Vector2(0, 0)
-        self.fog_active = True
-        self.fog_timer = 0.0
+        self.fog.reset()
         
         self.countdown_active = False
         self.countdown_start_time = 0
+        self.accumulator = 0.0
+        self.sim_time = 0
+        self.can_shoot = True
+        self.shoot_time = 0
         
-        self.all_sprites.empty()
-        self.collision_sprites.empty()
-        self.bullet_sprites.empty()
-        self.enemy_sprites.empty()
-        self.drop_sprites.empty()
+        # el mapa estático se conserva; solo se retiran las entidades dinámicas
+        for sprite in [*self.bullet_sprites, *self.enemy_sprites, *self.drop_sprites]:
+            sprite.kill()
+        if self.player:
+            self.player.kill()
+            self.gun.kill()
         
         self.setup()
 
+    def build_world(self):
+        """
+        Crea los sprites estáticos del mapa (suelo, objetos y colisiones) a partir de la plantilla compilada.
+        Solo se llama una vez por Game; los reinicios conservan estos sprites, el suelo pre-dibujado,
+        el índice espacial de colisiones y la rejilla del campo de flujo.
+        """
+        for x, y, image_index in self.world.ground:
+            Sprite((x, y), self.world.images[image_index], self.all_sprites)
+        for x, y, image_index in self.world.objects:
+            CollisionSprite((x, y), self.world.images[image_index], (self.all_sprites, self.collision_sprites))
+        for x, y, width, height in self.world.collisions:
+            CollisionSprite((x, y), pygame.Surface((width, height)), self.collision_sprites)
+        if GROUND_CHUNKS:
+            self.all_sprites.bake_ground()
+        self.collision_sprites.build_index()
+        # el campo de flujo se calcula para el enemigo con colisión más grande, así cabe cualquiera
+        clearance = [frames[0].get_rect().inflate(-20, -40).size for enemy_type, frames in self.enemy_frames.items() if enemy_type != 'ghost']
+        self.flow_field = FlowField(self.world.width, self.world.height, [sprite.rect for sprite in self.collision_sprites],
+                                    (max(width for width, _ in clearance) // 2, max(height for _, height in clearance) // 2))
+        if ENEMY_BATCH and EnemyBatch.supported:
+            self.enemy_batch = EnemyBatch([sprite.rect for sprite in self.collision_sprites],
+                                          (self.world.width * TILE_SIZE, self.world.height * TILE_SIZE), self.flow_field)
+
     def setup(self):
-        current_dir = os.path.dirname(__file__)
-        map = load_pygame(join(current_dir, 'Resources', 'map', 'maps', 'world.tmx'))
-        for x, y, image in map.get_layer_by_name('Ground').tiles():
-            Sprite((x * TILE_SIZE, y * TILE_SIZE), image, self.all_sprites)
-        for obj in map.get_layer_by_name('Objects'):
-            CollisionSprite((obj.x, obj.y), obj.image, (self.all_sprites, self.collision_sprites))
-        for obj in map.get_layer_by_name('Collisions'):
-            CollisionSprite((obj.x, obj.y), pygame.Surface((obj.width, obj.height)), self.collision_sprites)
-        player_pos = None
-        for obj in map.get_layer_by_name('Entities'):
-            if obj.name == 'Player':
-                self.player = Player((obj.x, obj.y), self.all_sprites, self.collision_sprites, self.drop_sprites, character=self.selected_character)
-                self.gun = Gun(self.player, self.all_sprites)
-                player_pos = (obj.x, obj.y)
-            else:
-                self.spawn_positions.append((obj.x, obj.y))
+        if self.world is None:
+            current_dir = os.path.dirname(__file__)
+            self.world = load_world(join(current_dir, 'Resources', 'map', 'maps', 'world.tmx'))
+            self.build_world()
+        player_pos = self.world.player_position
+        self.spawn_positions = list(self.world.spawn_positions)
         if player_pos:
+            self.player = Player(player_pos, self.all_sprites, self.collision_sprites, self.drop_sprites, character=self.selected_character)
+            self.gun = Gun(self.player, self.all_sprites)
             self.spawn_positions = [
                 pos for pos in self.spawn_positions
                 if pygame.math.Vector2(pos).distance_to(pygame.math.Vector2(player_pos)) > 50
@@ -407,22 +404,22 @@ class Game:
                 (100, 100), (200, 200), (300, 100), (100, 300), (400, 200),
                 (WINDOW_WIDTH - 100, WINDOW_HEIGHT - 100), (WINDOW_WIDTH - 200, WINDOW_HEIGHT - 200)
             ]
+        self.spawner.set_positions(self.spawn_positions)
 
     def bullet_collision(self):
         # colicion de las balas
         if self.bullet_sprites:
             for bullet in self.bullet_sprites:
-                collision_sprites = pygame.sprite.spritecollide(bullet, self.enemy_sprites, False, pygame.sprite.collide_mask)
+                collision_sprites = self.enemy_broad_phase.collide(bullet)
                 if collision_sprites:
-                    if self.impact_sound:
-                        self.impact_sound.play()
+                    audio.play('impact')
                     for sprite in collision_sprites:
                         sprite.take_damage(10)
                     bullet.kill()
 
     def player_collision(self):
         #colicion del jugador
-        collision_sprites = pygame.sprite.spritecollide(self.player, self.enemy_sprites, False, pygame.sprite.collide_mask)
+        collision_sprites = self.enemy_broad_phase.collide(self.player)
         if collision_sprites:
             for sprite in collision_sprites:
                 self.player.take_damage(sprite.damage)
@@ -431,50 +428,191 @@ class Game:
                     self.game_over_time = pygame.time.get_ticks()
                     self.save_scores()
 
+    def enemy_cap(self):
+        # enemigos simultáneos permitidos por tipo; crece con la dificultad
+        return self.max_enemies_per_type + SPAWN_CAP_PER_LEVEL * self.difficulty_level
+
     def spawn_enemies(self, enemy_type, base_pos):
-        #aparicion de los enemigos
-        if self.countdown_active:
+        #aparicion de los enemigos; devuelve False si no se generó
+        if self.countdown_active or self.enemies_active[enemy_type] >= self.enemy_cap():
+            return False
+        self.enemy_pool.acquire(base_pos, self.enemy_frames[enemy_type], 
+              (self.all_sprites, self.enemy_sprites), self.player, self.collision_sprites, 
+              enemy_type, self, self.drop_sprites)
+        self.enemies_active[enemy_type] += 1
+        return True
+
+    def spawn_wave(self, dt):
+        # genera las apariciones que el planificador de oleadas tiene previstas para este paso
+        if self.countdown_active or self.spawner is None:
             return
-        # print(f"Intentando generar {enemy_type} en {base_pos}")
-        if self.enemies_active[enemy_type] < self.max_enemies_per_type:
-            Enemy(base_pos, self.enemy_frames[enemy_type], 
-                  (self.all_sprites, self.enemy_sprites), self.player, self.collision_sprites, 
-                  enemy_type, self, self.drop_sprites)
-            self.enemies_active[enemy_type] += 1
-            # print(f"{enemy_type.capitalize()} generado, activos: {self.enemies_active[enemy_type]}")
-        else:
-            print(f"Límite alcanzado para {enemy_type}, no generado")
+        for enemy_type, position in self.spawner.update(dt, self.difficulty_level, self.enemies_active,
+                                                        self.enemy_cap(), self.all_sprites.camera_rect):
+            self.spawn_enemies(enemy_type, position)
 
     def update_fog(self, dt):
-        self.fog_timer += dt
-        if self.fog_active:
-            if self.fog_timer >= self.fog_active_duration:
-                self.fog_active = False
-                self.fog_timer = 0.0
-        else:
-            if self.fog_timer >= self.fog_inactive_duration:
-                self.fog_active = True
-                self.fog_timer = 0.0
-        self.fog_offset += self.fog_scroll_speed * dt
-        self.fog_offset.x %= WINDOW_WIDTH
-        self.fog_offset.y %= WINDOW_HEIGHT
-        if self.fog_active:
-            fog_alpha = self.fog_base_alpha + self.fog_alpha_variation * math.sin(
-                pygame.time.get_ticks() / 1000.0 * self.fog_alpha_speed
-            )
-            self.fog_surface.set_alpha(int(fog_alpha))
-        else:
-            self.fog_surface.set_alpha(0)
+        self.fog.update(dt)
 
     def draw_fog(self):
-        self.display_surface.blit(self.fog_surface, (self.fog_offset.x, self.fog_offset.y))
-        self.display_surface.blit(self.fog_surface, (self.fog_offset.x - WINDOW_WIDTH, self.fog_offset.y))
-        self.display_surface.blit(self.fog_surface, (self.fog_offset.x, self.fog_offset.y - WINDOW_HEIGHT))
-        self.display_surface.blit(self.fog_surface, (self.fog_offset.x - WINDOW_WIDTH, self.fog_offset.y - WINDOW_HEIGHT))
+        self.fog.draw(self.display_surface)
+
+    def update(self, dt):
+        """
+        Avanza la simulación un paso fijo de `dt` segundos.
+        Antes del paso se guardan las posiciones de los sprites para interpolar el dibujo
+        entre el estado anterior y el actual.
+        Args:
+            dt (float): Duración del paso, normalmente FIXED_DT.
+        """
+        self.all_sprites.store_previous()
+        self.update_world(dt)
+        self.update_collisions()
+        self.update_score(dt)
+
+    def update_world(self, dt):
+        # disparos, dificultad, niebla y movimiento de todos los sprites
+        self.sim_time += dt * 1000
+        with self.profiler.phase('input'):
+            self.gun_timer()
+            self.input()
+        with self.profiler.phase('spawn'):
+            self.spawn_wave(dt)
+        with self.profiler.phase('pathfinding'):
+            self.flow_field.update(self.player.rect.center)
+        with self.profiler.phase('update'):
+            self.update_difficulty(dt)
+            self.update_fog(dt)
+            self.all_sprites.update(dt)
+            if self.enemy_batch:
+                self.enemy_batch.update(dt, self.player.rect.center)
+            self.drop_sprites.update(dt)
+
+    def update_collisions(self):
+        with self.profiler.phase('broad_phase'):
+            self.enemy_broad_phase.rebuild(self.enemy_sprites)
+        with self.profiler.phase('bullet_collision'):
+            self.bullet_collision()
+        with self.profiler.phase('player_collision'):
+            self.player_collision()
+
+    def draw_light(self):
+        self.light.draw(self.display_surface, self.player.light_radius)
+
+    def draw_hud(self, interpolation=1.0):
+        # barras de salud y batería, barras de vida de los enemigos y puntaje; las barras de los
+        # enemigos siguen su posición interpolada, la misma con la que se dibujó cada sprite
+        bar_width = 200
+        bar_height = 20
+        bar_x = 10
+        bar_y = 40
+        max_health = self.player.max_health
+        current_health = self.player.health
+        health_ratio = current_health / max_health
+        fill_color = (0, 255, 0) if health_ratio > 0.3 else (255, 0, 0)
+        self.hud.bar('health', (bar_x, bar_y, bar_width, bar_height), health_ratio, fill_color)
+        
+        bar_y = 10
+        max_charge = 100
+        current_charge = self.player.light_charge
+        fill_color = (0, 255, 0) if current_charge > 20 else (255, 0, 0)
+        self.hud.bar('charge', (bar_x, bar_y, bar_width, bar_height), current_charge / max_charge, fill_color)
+        
+        camera_rect = self.all_sprites.camera_rect
+        for sprite in self.enemy_sprites:
+            if hasattr(sprite, 'draw_health_bar') and sprite.death_time == 0 and hasattr(sprite, 'health') and camera_rect.colliderect(sprite.rect):
+                offset = self.all_sprites.interpolated_topleft(sprite, interpolation) - sprite.rect.topleft + self.all_sprites.offset
+                sprite.draw_health_bar(self.display_surface, offset)
+        
+        self.draw_score()
+        self.hud.draw(self.display_surface)
+
+    def draw(self, interpolation=1.0):
+        """
+        Dibuja un fotograma completo del juego.
+        Args:
+            interpolation (float): Fracción (0-1) del paso fijo transcurrida desde la última
+                                   actualización; los sprites se dibujan entre su posición
+                                   anterior y la actual según este valor.
+        """
+        with self.profiler.phase('draw'):
+            self.display_surface.fill('black')
+            self.all_sprites.draw(self.player.rect.center, interpolation, self.player)
+        with self.profiler.phase('fog'):
+            self.draw_fog()
+        with self.profiler.phase('light'):
+            self.draw_light()
+        with self.profiler.phase('hud'):
+            self.draw_hud(interpolation)
+            if self.countdown_active:
+                self.draw_countdown()
+
+    def bind_events(self):
+        # manejadores de eventos de la partida y de la pausa (ver events.py)
+        events.bind('playing', pygame.QUIT, self.quit)
+        events.bind('playing', pygame.KEYDOWN, self.pause, (pygame.K_ESCAPE,))
+        events.bind('playing', pygame.KEYDOWN, lambda event: self.profiler.toggle(), (pygame.K_F3,))
+        events.bind('playing', pygame.KEYDOWN, self.export_trace, (pygame.K_F4,))
+        events.bind('paused', pygame.QUIT, self.quit)
+        events.bind('paused', pygame.KEYDOWN, self.resume, (pygame.K_ESCAPE,))
+        events.bind('paused', pygame.KEYDOWN, lambda event: self.move_pause_selection(-1), (pygame.K_UP,))
+        events.bind('paused', pygame.KEYDOWN, lambda event: self.move_pause_selection(1), (pygame.K_DOWN,))
+        events.bind('paused', pygame.KEYDOWN, self.select_pause_option, (pygame.K_RETURN,))
+        events.install()
+
+    def state(self):
+        # pantalla de la partida que recibe los eventos
+        return 'paused' if self.paused else 'playing'
+
+    def handle_events(self):
+        # eventos durante la partida: salir, pausa y teclas del perfilador
+        return events.dispatch(self.state)
+
+    def quit(self, event=None):
+        self.running = False
+        audio.stop_music()
+
+    def pause(self, event=None):
+        if self.game_active:
+            self.paused = True
+            self.game_active = False
+
+    def resume(self, event=None):
+        self.paused = False
+        self.game_active = True
+        audio.unpause_music()
+
+    def export_trace(self, event=None):
+        if self.profiler.enabled:
+            trace_path = f"trace-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+            count = self.profiler.export_trace(trace_path)
+            print(f"Traza guardada en {trace_path} ({count} eventos)")
+
+    def move_pause_selection(self, step):
+        self.pause_selected_option = (self.pause_selected_option + step) % len(self.pause_options)
+
+    def select_pause_option(self, event=None):
+        # ejecuta la opción elegida en la pausa; devuelve True si hay que salir al menú principal
+        if self.pause_options[self.pause_selected_option] == 'Continuar':
+            self.resume()
+        elif self.pause_options[self.pause_selected_option] == 'Reiniciar':
+            self.reset_game()
+            self.game_active = True
+            self.countdown_active = True
+            self.countdown_start_time = pygame.time.get_ticks()
+            self.player.countdown_active = True
+            self.player.reset_flashlight()
+            audio.unpause_music()
+        elif self.pause_options[self.pause_selected_option] == 'Menú Principal':
+            self.save_scores()
+            audio.stop_music()
+            self.running = False
+            return True
 
     def run(self):
-        # corre el juego 
+        # corre una partida; la misma instancia se reutiliza en todas las rondas (ver App)
         self.reset_game()
+        self.running = True
+        self.clock.tick()  # el tiempo pasado en el menú no cuenta como primer fotograma
         self.game_active = True
         
         self.countdown_active = True
@@ -482,43 +620,13 @@ class Game:
         self.player.countdown_active = True
         self.player.reset_flashlight()
         
-        if not pygame.mixer.music.get_busy():
-            self.play_music()
+        audio.play_music(restart=False)
         while self.running:
-            dt = self.clock.tick() / 1000
+            frame_time = self.clock.tick(MAX_FPS) / 1000
             
             if self.paused:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        self.running = False
-                        self.stop_music()
-                    if event.type == pygame.KEYDOWN:
-                        if event.key == pygame.K_ESCAPE:
-                            self.paused = False
-                            self.game_active = True
-                            self.unpause_music()
-                        elif event.key == pygame.K_UP:
-                            self.pause_selected_option = (self.pause_selected_option - 1) % len(self.pause_options)
-                        elif event.key == pygame.K_DOWN:
-                            self.pause_selected_option = (self.pause_selected_option + 1) % len(self.pause_options)
-                        elif event.key == pygame.K_RETURN:
-                            if self.pause_options[self.pause_selected_option] == 'Continuar':
-                                self.paused = False
-                                self.game_active = True
-                                self.unpause_music()
-                            elif self.pause_options[self.pause_selected_option] == 'Reiniciar':
-                                self.reset_game()
-                                self.game_active = True
-                                self.countdown_active = True
-                                self.countdown_start_time = pygame.time.get_ticks()
-                                self.player.countdown_active = True
-                                self.player.reset_flashlight()
-                                self.unpause_music()
-                            elif self.pause_options[self.pause_selected_option] == 'Menú Principal':
-                                self.save_scores()
-                                self.stop_music()
-                                self.running = False
-                                return
+                if self.handle_events():
+                    return
                 self.draw_pause_menu()
                 pygame.display.update()
                 continue
@@ -527,91 +635,59 @@ class Game:
                 self.game_active = False
                 self.draw_game_over()
                 if pygame.time.get_ticks() - self.game_over_time >= self.game_over_duration:
-                    self.stop_music()
+                    audio.stop_music()
                     return
                 continue
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    self.stop_music()
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE and self.game_active:
-                        self.paused = True
-                        self.game_active = False
-                if event.type == self.enemy_event and self.game_active and not self.countdown_active:
-                    enemy_type = choice(['ghost', 'bat', 'skeleton'])
-                    self.spawn_enemies(enemy_type, choice(self.spawn_positions))
+            self.profiler.begin_frame()
+            with self.profiler.phase('events'):
+                if self.handle_events():
+                    return
                     
             if self.game_active:
-                self.gun_timer()
-                self.input()
-                self.update_difficulty(dt)
-                self.update_fog(dt)
-                self.all_sprites.update(dt)
-                self.drop_sprites.update(dt)
-                self.bullet_collision()
-                self.player_collision()
-                self.update_score(dt)
+                self.accumulator += min(frame_time, MAX_FRAME_TIME)
+                while self.accumulator >= FIXED_DT and self.game_active and not self.game_over:
+                    self.update(FIXED_DT)
+                    self.accumulator -= FIXED_DT
             
-            self.display_surface.fill('black')
-            self.all_sprites.draw(self.player.rect.center)
-            self.draw_fog()
-            self.light_surface.fill((10, 10, 20))
-            light_pos = (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2)
-            pygame.draw.circle(self.light_surface, (255, 255, 200), light_pos, self.player.light_radius)
-            self.light_surface.set_colorkey((255, 255, 200))
-            self.light_surface.set_alpha(230)
-            self.display_surface.blit(self.light_surface, (0, 0))
-            
-            bar_width = 200
-            bar_height = 20
-            bar_x = 10
-            bar_y = 40
-            max_health = self.player.max_health
-            current_health = self.player.health
-            health_ratio = current_health / max_health
-            pygame.draw.rect(self.display_surface, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height))
-            fill_color = (0, 255, 0) if health_ratio > 0.3 else (255, 0, 0)
-            fill_width = bar_width * health_ratio
-            pygame.draw.rect(self.display_surface, fill_color, (bar_x, bar_y, fill_width, bar_height))
-            
-            bar_y = 10
-            max_charge = 100
-            current_charge = self.player.light_charge
-            pygame.draw.rect(self.display_surface, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height))
-            fill_color = (0, 255, 0) if current_charge > 20 else (255, 0, 0)
-            fill_width = (current_charge / max_charge) * bar_width
-            pygame.draw.rect(self.display_surface, fill_color, (bar_x, bar_y, fill_width, bar_height))
-            
-            for sprite in self.enemy_sprites:
-                if hasattr(sprite, 'draw_health_bar') and sprite.death_time == 0 and hasattr(sprite, 'health'):
-                    sprite.draw_health_bar(self.display_surface, self.all_sprites.offset)
-            
-            self.draw_score()
-            
-            if self.countdown_active:
-                self.draw_countdown()
-            
-            pygame.display.update()
+            self.draw(self.accumulator / FIXED_DT)
+            self.profiler.draw(self.display_surface)
+            with self.profiler.phase('display'):
+                pygame.display.update()
+            self.profiler.end_frame()
             
-        self.stop_music()
+        audio.stop_music()
+
+class App:
+    def __init__(self):
+        """
+        Aplicación de larga duración: crea una sola vez la ventana, la partida y el menú, y los
+        reutiliza en todas las rondas. Entre rondas se conservan el mundo ya construido, los
+        assets en caché, los pools de sprites y la música; reset_game() solo retira las
+        entidades de la ronda anterior, así volver del game over al menú y empezar otra partida
+        tarda milisegundos y la memoria no crece con las rondas.
+        Atributos:
+            scores (ScoreStore): Historial de puntajes; se abre aquí, no al importar scores.py.
+            game (Game): Partida reutilizada.
+            menu (Menu): Menú reutilizado.
+            rounds (int): Partidas jugadas desde el inicio.
+        """
+        self.scores = ScoreStore(SCORE_LOG_PATH, legacy_path=SCORE_LEGACY_PATH)
+        self.game = Game(self.scores)
+        self.menu = Menu(self.game)
+        self.rounds = 0
+
+    def run(self):
+        # menú -> partida -> menú...; el splash con la carga de assets solo se muestra la primera vez
+        while self.menu.run(start_with_main_menu=True, splash=self.rounds == 0):
+            self.game.run()
+            self.rounds += 1
+        audio.stop_music()
+        self.scores.close()
+        pygame.quit()
+
 
 if __name__ == "__main__":
     # funcion principal 
     pygame.init()
-    while True:
-        try:
-            pygame.mixer.music.stop()
-        except pygame.error:
-            pass
-        game = Game()
-        menu = Menu(game)
-        if not menu.run(start_with_main_menu=True):
-            try:
-                pygame.mixer.music.stop()
-            except pygame.error:
-                pass
-            pygame.quit()
-            break
-        game.run()
\ No newline at end of file
+    App().run()
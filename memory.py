@@ -0,0 +1,102 @@
+from settings import *
+from datetime import datetime
+import gc
+import time
+import tracemalloc
+import weakref
+
+class MemoryTracker:
+    def __init__(self, interval=MEMORY_REPORT_INTERVAL, path=MEMORY_REPORT_PATH, trace=MEMORY_TRACEMALLOC):
+        """
+        Contabilidad de memoria para sesiones largas.
+        Los módulos que crean superficies duraderas las registran con track() indicando su origen
+        (asset, atlas, transform, text, light, fog, ground); el registro es débil, así que una
+        superficie deja de contar en cuanto nadie la usa y lo que sigue vivo es exactamente lo
+        que se está reteniendo. Junto a los grupos de sprites registrados con watch(), update()
+        escribe cada `interval` segundos una línea compacta en `path` y, si `trace` está activo,
+        las líneas de código cuya memoria más creció desde el informe anterior según tracemalloc.
+        Args:
+            interval (float): Segundos entre informes (0 = sin informes periódicos).
+            path (str): Archivo donde se añaden los informes.
+            trace (bool): Activa tracemalloc y añade al informe la diferencia entre instantáneas.
+        Atributos:
+            surfaces (WeakKeyDictionary): Surface -> origen.
+            groups (WeakValueDictionary): Nombre -> grupo de sprites vigilado; vigilar un grupo no
+                                          lo mantiene vivo (ni a la partida que lo creó).
+            next_report (float): Momento (time.monotonic) del próximo informe.
+            snapshot (tracemalloc.Snapshot): Instantánea del informe anterior, con `trace`.
+        """
+        self.interval = interval
+        self.path = path
+        self.trace = trace
+        self.surfaces = weakref.WeakKeyDictionary()
+        self.groups = weakref.WeakValueDictionary()
+        self.next_report = time.monotonic() + interval
+        self.snapshot = None
+        if trace and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def track(self, surface, origin):
+        # las subsuperficies comparten la memoria de su padre: solo se cuenta el padre
+        if surface.get_parent() is None:
+            self.surfaces[surface] = origin
+        return surface
+
+    def watch(self, name, group):
+        self.groups[name] = group
+
+    def surface_totals(self):
+        """
+        Returns:
+            dict: Origen -> (superficies vivas, bytes de píxeles).
+        """
+        totals = {}
+        for surface, origin in list(self.surfaces.items()):
+            count, size = totals.get(origin, (0, 0))
+            totals[origin] = (count + 1, size + surface.get_width() * surface.get_height() * surface.get_bytesize())
+        return totals
+
+    def report(self):
+        """
+        Genera el informe actual.
+        Returns:
+            list: Líneas del informe; la primera resume superficies y sprites, las siguientes (solo
+            con tracemalloc) son las mayores diferencias de memoria desde el informe anterior.
+        """
+        # los objetos que solo se mantienen por ciclos de referencias (una partida descartada, con
+        # sus sprites apuntándose entre sí) no cuentan como retenidos
+        gc.collect()
+        totals = self.surface_totals()
+        surfaces = ' '.join(f"{origin}={count}/{size / 1048576:.1f}MB" for origin, (count, size) in sorted(totals.items()))
+        total_bytes = sum(size for _, size in totals.values())
+        sprites = ' '.join(f"{name}={len(group)}" for name, group in list(self.groups.items()))
+        lines = [f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} superficies {surfaces} total={total_bytes / 1048576:.1f}MB | sprites {sprites}"]
+
+        if self.trace and tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+            current, peak = tracemalloc.get_traced_memory()
+            lines.append(f"  tracemalloc actual={current / 1048576:.1f}MB pico={peak / 1048576:.1f}MB")
+            if self.snapshot is not None:
+                for stat in snapshot.compare_to(self.snapshot, 'lineno')[:MEMORY_TRACE_TOP]:
+                    lines.append(f"  {stat.size_diff / 1024:+.1f}KB {stat.count_diff:+d} {stat.traceback}")
+            self.snapshot = snapshot
+        return lines
+
+    def write_report(self):
+        try:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write('\n'.join(self.report()) + '\n')
+        except OSError as e:
+            print(f"Error al guardar informe de memoria: {e}")
+
+    def update(self):
+        # se llama en cada fotograma del menú (no de la partida); solo trabaja cuando toca un informe
+        if not self.interval:
+            return
+        now = time.monotonic()
+        if now >= self.next_report:
+            self.next_report = now + self.interval
+            self.write_report()
+
+
+memory = MemoryTracker()
@@ -1,5 +1,11 @@
 import pygame
 from settings import *
+from assets import assets
+from loader import loader
+from hud import text_cache
+from events import events
+from audio import audio
+from memory import memory
 
 class Menu:
     def __init__(self, game):
@@ -26,31 +32,29 @@ class Menu:
         self.fade_duration = 1000
         self.splash_alpha = 255
         
-        # Cargar música de fondo usando pygame.mixer.music
-        try:
-            pygame.mixer.music.load(join('audio', 'principal.mp3'))
-            pygame.mixer.music.set_volume(1)
-        except pygame.error as e:
-            print(f"Error al cargar música: {e}")
+        # Redibujado por zonas: pantalla mostrada, widgets dibujados en ella y zonas por actualizar
+        self.clock = pygame.time.Clock()
+        self.screen = None
+        self.widgets = {}
+        self.dirty = []
         
-        self.char_selection_bg = pygame.image.load(join('Resources', 'img', 'Personaje.png')).convert_alpha()
-        self.char_selection_bg = pygame.transform.scale(self.char_selection_bg, (WINDOW_WIDTH, WINDOW_HEIGHT))
+        # música de fondo compartida con la partida (ver audio.py); solo se carga la primera vez
+        audio.load_music(join('audio', 'principal.mp3'))
         
-        self.menu_bg = pygame.image.load(join('Resources', 'img', 'Menu.png')).convert_alpha()
-        self.menu_bg = pygame.transform.scale(self.menu_bg, (WINDOW_WIDTH, WINDOW_HEIGHT))
-        
-        self.splash_bg = pygame.image.load(join('Resources', 'img', 'PreMenu.png')).convert_alpha()
-        self.splash_bg = pygame.transform.scale(self.splash_bg, (WINDOW_WIDTH, WINDOW_HEIGHT))
+        # el splash se carga ya para mostrarlo al instante; el resto de fondos llega en segundo plano
+        self.splash_bg = assets.image(join('Resources', 'img', 'PreMenu.png'), scale=(WINDOW_WIDTH, WINDOW_HEIGHT))
         self.splash_surface = self.splash_bg.copy()
-        
-        self.help_bg = pygame.image.load(join('Resources', 'img', 'Ayuda.png')).convert_alpha()
-        self.help_bg = pygame.transform.scale(self.help_bg, (WINDOW_WIDTH, WINDOW_HEIGHT))
-        
-        self.scores_bg = pygame.image.load(join('Resources', 'img', 'Scores.png')).convert_alpha()
-        self.scores_bg = pygame.transform.scale(self.scores_bg, (WINDOW_WIDTH, WINDOW_HEIGHT))
-        
-        self.name_input_bg = pygame.image.load(join('Resources', 'img', 'NameInput.png')).convert_alpha()
-        self.name_input_bg = pygame.transform.scale(self.name_input_bg, (WINDOW_WIDTH, WINDOW_HEIGHT))        
+        self.background_files = {
+            'char_selection_bg': 'Personaje.png',
+            'menu_bg': 'Menu.png',
+            'help_bg': 'Ayuda.png',
+            'scores_bg': 'Scores.png',
+            'name_input_bg': 'NameInput.png',
+        }
+        self.backgrounds_ready = False
+        self.menu_bg = None
+        for file_name in self.background_files.values():
+            loader.image(join('Resources', 'img', file_name), scale=(WINDOW_WIDTH, WINDOW_HEIGHT))
                 
         self.option_areas = [
             pygame.Rect(WINDOW_WIDTH // 2 - 100, WINDOW_HEIGHT // 2 - 170 - 25, 200, 40),  # Jugar
@@ -62,20 +66,61 @@ class Menu:
             pygame.Rect(350, 150, 250, 450),  # Personaje Veronica
             pygame.Rect(700, 150, 250, 450)   # Personaje Santiago
         ]
+        self.bind_events()
 
-    def play_music(self):
-        """Inicia o reinicia la música del menú."""
-        try:
-            pygame.mixer.music.play(loops=-1)
-        except pygame.error as e:
-            print(f"Error al reproducir música: {e}")
+    def load_backgrounds(self):
+        # asigna los fondos del menú desde la caché, esperando a la carga en segundo plano si hace falta
+        if self.backgrounds_ready:
+            return
+        loader.wait()
+        for attribute, file_name in self.background_files.items():
+            setattr(self, attribute, assets.image(join('Resources', 'img', file_name), scale=(WINDOW_WIDTH, WINDOW_HEIGHT)))
+        self.backgrounds_ready = True
 
-    def stop_music(self):
-        """Detiene la música del menú."""
-        try:
-            pygame.mixer.music.stop()
-        except pygame.error as e:
-            print(f"Error al detener música: {e}")
+    def begin_screen(self, name, background):
+        """
+        Empieza a dibujar una pantalla del menú. Solo si es distinta de la que ya se ve se pega
+        su fondo y se marca la ventana completa para actualizar; si es la misma, el fondo sigue
+        en pantalla y únicamente se redibujan los widgets que cambiaron (ver widget()).
+        Args:
+            name (str): Nombre de la pantalla.
+            background (pygame.Surface): Fondo estático de la pantalla.
+        """
+        if self.screen == name:
+            return
+        self.screen = name
+        self.widgets = {}
+        self.display_surface.blit(background, (0, 0))
+        self.dirty = [self.display_surface.get_rect()]
+
+    def widget(self, name, value, background, draw):
+        """
+        Dibuja un elemento de la pantalla (cursor, texto) solo si su valor cambió desde el último
+        fotograma, restaurando antes el fondo bajo su posición anterior.
+        Args:
+            name (str): Nombre del elemento.
+            value: Valor que determina su aspecto (opción seleccionada, texto mostrado...).
+            background (pygame.Surface): Fondo de la pantalla, para borrar la posición anterior.
+            draw (callable): Dibuja el elemento y devuelve el rectángulo que ocupa.
+        """
+        previous = self.widgets.get(name)
+        if previous and previous[0] == value:
+            return
+        if previous:
+            self.display_surface.blit(background, previous[1], previous[1])
+            self.dirty.append(previous[1])
+        rect = draw()
+        self.widgets[name] = (value, rect)
+        self.dirty.append(rect)
+
+    def present(self):
+        # actualiza solo las zonas que cambiaron y limita los fotogramas para no ocupar la CPU en reposo
+        if self.dirty:
+            pygame.display.update(self.dirty)
+            self.dirty = []
+        self.clock.tick(MENU_FPS)
+        # los informes de memoria solo se escriben en el menú: en la partida serían un tirón visible
+        memory.update()
 
     def draw_menu(self):
         """
@@ -84,10 +129,11 @@ class Menu:
         al lado de la opción actualmente seleccionada para indicar la selección del usuario.
         El triángulo se posiciona a la izquierda de la opción seleccionada, utilizando
         las coordenadas del rectángulo correspondiente en `self.option_areas`.
+        El fondo se pega solo al entrar en la pantalla y el triángulo solo cuando cambia la opción.
         No recibe parámetros adicionales y no retorna ningún valor.
         """
         
-        self.display_surface.blit(self.menu_bg, (0, 0))
+        self.begin_screen('menu', self.menu_bg)
         selected_rect = self.option_areas[self.selected_option]
         triangle_size = 15
         triangle_points = [
@@ -95,7 +141,8 @@ class Menu:
             (selected_rect.left - 45, selected_rect.centery - triangle_size),
             (selected_rect.left - 45, selected_rect.centery + triangle_size)
         ]
-        pygame.draw.polygon(self.display_surface, (255, 255, 0), triangle_points)
+        self.widget('cursor', self.selected_option, self.menu_bg,
+                    lambda: pygame.draw.polygon(self.display_surface, (255, 255, 0), triangle_points))
 
     def draw_splash(self):
         """
@@ -106,14 +153,28 @@ class Menu:
             - Mostrar una pantalla de bienvenida o transición antes de mostrar el menú principal.
         Variables utilizadas:
             self.display_surface: Superficie principal donde se dibujan los elementos.
-            self.menu_bg: Imagen de fondo del menú.
+            self.menu_bg: Imagen de fondo del menú (negro mientras no ha cargado).
             self.splash_surface: Imagen de la pantalla de presentación.
             self.splash_alpha: Valor de transparencia para la imagen de splash (0-255).
         """
         
-        self.display_surface.blit(self.menu_bg, (0, 0))
+        if self.menu_bg:
+            self.display_surface.blit(self.menu_bg, (0, 0))
+        else:
+            self.display_surface.fill('black')
         self.splash_surface.set_alpha(int(self.splash_alpha))
         self.display_surface.blit(self.splash_surface, (0, 0))
+        if not loader.finished:
+            self.draw_loading_bar(loader.progress)
+        # el splash cambia entero en cada fotograma; la pantalla siguiente se dibuja completa
+        self.screen = 'splash'
+        self.dirty = [self.display_surface.get_rect()]
+
+    def draw_loading_bar(self, progress):
+        # barra de progreso de la carga en segundo plano, al pie del splash
+        bar = pygame.Rect(WINDOW_WIDTH // 2 - 200, WINDOW_HEIGHT - 60, 400, 12)
+        pygame.draw.rect(self.display_surface, (60, 60, 60), bar)
+        pygame.draw.rect(self.display_surface, (255, 255, 0), (bar.left, bar.top, bar.width * progress, bar.height))
 
     def draw_scores(self): 
         """
@@ -125,20 +186,21 @@ class Menu:
                 - self.display_surface: Superficie donde se dibuja.
                 - self.scores_bg: Imagen de fondo para la sección de puntuaciones.
                 - self.game.high_scores: Lista de diccionarios con las puntuaciones más altas.
-                - self.font: Fuente utilizada para renderizar el texto.
+                - self.font: Fuente utilizada para renderizar el texto (a través de text_cache).
         Retorno:
             None
         """
                
-        self.display_surface.blit(self.scores_bg, (0, 0))                
+        self.begin_screen('scores', self.scores_bg)
 
         for i, score in enumerate(self.game.high_scores):
             text = f"{score['name']}: {score['score']} ({score['date']})"
-            score_text = self.font.render(text, True, (255, 255, 255))
-            self.display_surface.blit(score_text, (WINDOW_WIDTH // 2 - 210, 180 + i * 75))
+            score_text = text_cache.render(self.font, text)
+            self.widget(f'score{i}', text, self.scores_bg,
+                        lambda: self.display_surface.blit(score_text, (WINDOW_WIDTH // 2 - 210, 180 + i * 75)))
 
     def draw_help(self):
-        self.display_surface.blit(self.help_bg, (0, 0))
+        self.begin_screen('help', self.help_bg)
 
     def draw_name_input(self):
         """
@@ -148,16 +210,19 @@ class Menu:
         milisegundos es divisible por 1000 y menor que 500, se agrega un punto 
         parpadeante al final del nombre del jugador.
         La posición del texto se calcula en base al ancho y alto de la ventana 
-        (WINDOW_WIDTH y WINDOW_HEIGHT).
+        (WINDOW_WIDTH y WINDOW_HEIGHT). Solo se redibuja el campo de texto cuando
+        cambia el nombre o el punto parpadeante.
         Parámetros:
         - No recibe parámetros.
         Retorno:
         - No retorna ningún valor.
         """
         
-        self.display_surface.blit(self.name_input_bg, (0, 0))        
-        name_text = self.name_font.render(self.player_name + ('.' if pygame.time.get_ticks() % 1000 < 500 else ''), True, (255, 255, 255))
-        self.display_surface.blit(name_text, (WINDOW_WIDTH // 2 + 75, WINDOW_HEIGHT // 2 - 32))
+        self.begin_screen('name_input', self.name_input_bg)
+        text = self.player_name + ('.' if pygame.time.get_ticks() % 1000 < 500 else '')
+        name_text = text_cache.render(self.name_font, text)
+        self.widget('name', text, self.name_input_bg,
+                    lambda: self.display_surface.blit(name_text, (WINDOW_WIDTH // 2 + 75, WINDOW_HEIGHT // 2 - 32)))
 
     def draw_character_selection(self):
         """
@@ -173,10 +238,10 @@ class Menu:
         Detalles:
             - El triángulo amarillo tiene un tamaño de 20 píxeles.
             - Se calcula la posición del triángulo basado en el rectángulo del personaje seleccionado.
-            - El triángulo se dibuja utilizando `pygame.draw.polygon`.
+            - El triángulo se dibuja utilizando `pygame.draw.polygon`, solo al cambiar la selección.
         """
         
-        self.display_surface.blit(self.char_selection_bg, (0, 0))
+        self.begin_screen('character_selection', self.char_selection_bg)
         triangle_size = 20
         selected_rect = self.char_areas[self.selected_character]
         triangle_points = [
@@ -184,90 +249,117 @@ class Menu:
             (selected_rect.centerx - 10, selected_rect.bottom),
             (selected_rect.centerx + 10, selected_rect.bottom)
         ]
-        pygame.draw.polygon(self.display_surface, (255, 255, 0), triangle_points)
+        self.widget('cursor', self.selected_character, self.char_selection_bg,
+                    lambda: pygame.draw.polygon(self.display_surface, (255, 255, 0), triangle_points))
 
-    def handle_input_name(self):
-        """
-        Maneja la entrada del nombre del jugador mediante eventos de Pygame.
-        Este método procesa los eventos generados por Pygame para permitir al jugador
-        ingresar su nombre. Realiza las siguientes acciones según el tipo de evento:
-        - Si se detecta un evento de salida (pygame.QUIT), detiene la música y finaliza el bucle.
-        - Si se presiona la tecla Enter (pygame.K_RETURN) y el nombre del jugador no está vacío,
-          guarda el nombre del jugador, desactiva la entrada de nombre y activa la selección de personaje.
-        - Si se presiona la tecla Backspace (pygame.K_BACKSPACE), elimina el último carácter del nombre.
-        - Si se presiona la tecla Escape (pygame.K_ESCAPE), desactiva la entrada de nombre y limpia el nombre.
-        - Si el nombre tiene menos de 10 caracteres y el carácter ingresado es imprimible,
-          agrega el carácter al nombre del jugador.
-        Retorno:
-            - False: Si se detecta un evento de salida (pygame.QUIT).
-            - None: En cualquier otro caso.
-        Atributos modificados:
-            - self.player_name: Actualiza el nombre del jugador según la entrada.
-            - self.input_name_active: Cambia el estado de la entrada de nombre.
-            - self.character_selection_active: Activa la selección de personaje.
-        Restricciones:
-            - El nombre del jugador no puede exceder los 10 caracteres.
-            - Solo se aceptan caracteres imprimibles.
+    def bind_events(self):
         """
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.stop_music()
-                return False
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_RETURN and self.player_name.strip():
-                    self.game.player_name = self.player_name.strip()
-                    self.input_name_active = False
-                    self.character_selection_active = True
-                    return None
-                elif event.key == pygame.K_BACKSPACE:
-                    self.player_name = self.player_name[:-1]
-                elif event.key == pygame.K_ESCAPE:
-                    self.input_name_active = False
-                    self.player_name = ""
-                elif len(self.player_name) < 10 and event.unicode.isprintable():
-                    self.player_name += event.unicode
-        return None
-
-    def handle_character_selection(self):
+        Registra los manejadores de cada pantalla del menú en el despachador de eventos (ver events.py).
+        Estados:
+            - 'splash': solo cerrar la ventana.
+            - 'menu': flechas o W/S para moverse entre opciones y Enter para elegir.
+            - 'name_input': escribir el nombre (máximo 10 caracteres imprimibles), Backspace para
+              borrar, Enter para confirmar y Escape para volver al menú.
+            - 'character_selection': flechas o A/D para cambiar de personaje, Enter para confirmar
+              y Escape para volver al menú.
+            - 'scores' y 'help': Escape para volver al menú.
+        En todas, cerrar la ventana detiene la música y hace que run() devuelva False, y si la
+        ventana se vuelve a mostrar la pantalla se redibuja completa.
         """
-        Maneja la lógica de selección de personaje en el menú del juego.
-        Este método procesa los eventos de entrada del usuario para permitir la selección
-        de un personaje, la confirmación de la selección, o la salida del menú de selección.
-        Eventos manejados:
-        - pygame.QUIT: Detiene la música y sale del menú de selección.
-        - pygame.KEYDOWN:
-            - Flecha izquierda (K_LEFT) o tecla 'A': Cambia al personaje anterior en la lista.
-            - Flecha derecha (K_RIGHT) o tecla 'D': Cambia al siguiente personaje en la lista.
-            - Enter (K_RETURN): Confirma la selección del personaje y desactiva el menú de selección.
-            - Escape (K_ESCAPE): Cancela la selección y limpia el nombre del jugador.
-        Retorno:
-        - False: Si se detecta un evento de salida (pygame.QUIT).
-        - True: Si se confirma la selección del personaje (K_RETURN).
-        - None: Si no se realiza ninguna acción relevante o se cancela la selección (K_ESCAPE).
-        """
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.stop_music()
-                return False
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_LEFT or event.key == pygame.K_a:
-                    self.selected_character = (self.selected_character - 1) % len(self.characters)
-                elif event.key == pygame.K_RIGHT or event.key == pygame.K_d:
-                    self.selected_character = (self.selected_character + 1) % len(self.characters)
-                elif event.key == pygame.K_RETURN:
-                    self.game.selected_character = self.characters[self.selected_character]
-                    self.character_selection_active = False
-                    # self.stop_music()  # Detener música antes de iniciar el juego
-                    return True
-                elif event.key == pygame.K_ESCAPE:
-                    self.character_selection_active = False
-                    self.player_name = ""
-                    return None
-        return None
-
-    def run(self, start_with_main_menu=True):
+        states = ['splash', 'menu', 'name_input', 'character_selection', 'scores', 'help']
+        for state in states:
+            events.bind(state, pygame.QUIT, self.quit)
+            events.bind(state, pygame.WINDOWEXPOSED, self.expose)
+            events.bind(state, pygame.VIDEOEXPOSE, self.expose)
+
+        events.bind('menu', pygame.KEYDOWN, lambda event: self.move_option(-1), (pygame.K_UP, pygame.K_w))
+        events.bind('menu', pygame.KEYDOWN, lambda event: self.move_option(1), (pygame.K_DOWN, pygame.K_s))
+        events.bind('menu', pygame.KEYDOWN, self.select_option, (pygame.K_RETURN,))
+
+        events.bind('name_input', pygame.KEYDOWN, self.type_name)
+        events.bind('name_input', pygame.KEYDOWN, self.confirm_name, (pygame.K_RETURN,))
+        events.bind('name_input', pygame.KEYDOWN, self.erase_name, (pygame.K_BACKSPACE,))
+        events.bind('name_input', pygame.KEYDOWN, self.cancel_name, (pygame.K_ESCAPE,))
+
+        events.bind('character_selection', pygame.KEYDOWN, lambda event: self.move_character(-1), (pygame.K_LEFT, pygame.K_a))
+        events.bind('character_selection', pygame.KEYDOWN, lambda event: self.move_character(1), (pygame.K_RIGHT, pygame.K_d))
+        events.bind('character_selection', pygame.KEYDOWN, self.confirm_character, (pygame.K_RETURN,))
+        events.bind('character_selection', pygame.KEYDOWN, self.cancel_character, (pygame.K_ESCAPE,))
+
+        events.bind('scores', pygame.KEYDOWN, self.close_scores, (pygame.K_ESCAPE,))
+        events.bind('help', pygame.KEYDOWN, self.close_help, (pygame.K_ESCAPE,))
+        events.install()
+
+    def state(self):
+        # pantalla del menú que recibe los eventos y se dibuja
+        if self.show_splash:
+            return 'splash'
+        if self.input_name_active:
+            return 'name_input'
+        if self.character_selection_active:
+            return 'character_selection'
+        if self.show_scores:
+            return 'scores'
+        if self.show_help:
+            return 'help'
+        return 'menu'
+
+    def quit(self, event=None):
+        audio.stop_music()
+        return False
+
+    def expose(self, event=None):
+        self.screen = None
+
+    def move_option(self, step):
+        self.selected_option = (self.selected_option + step) % len(self.options)
+
+    def select_option(self, event=None):
+        if self.options[self.selected_option] == 'Jugar':
+            self.input_name_active = True
+        elif self.options[self.selected_option] == 'Puntajes':
+            self.show_scores = True
+        elif self.options[self.selected_option] == 'Ayuda':
+            self.show_help = True
+        elif self.options[self.selected_option] == 'Salir':
+            return self.quit()
+
+    def type_name(self, event):
+        if len(self.player_name) < 10 and event.unicode.isprintable():
+            self.player_name += event.unicode
+
+    def confirm_name(self, event=None):
+        if self.player_name.strip():
+            self.game.player_name = self.player_name.strip()
+            self.input_name_active = False
+            self.character_selection_active = True
+
+    def erase_name(self, event=None):
+        self.player_name = self.player_name[:-1]
+
+    def cancel_name(self, event=None):
+        self.input_name_active = False
+        self.player_name = ""
+
+    def move_character(self, step):
+        self.selected_character = (self.selected_character + step) % len(self.characters)
+
+    def confirm_character(self, event=None):
+        self.game.selected_character = self.characters[self.selected_character]
+        self.character_selection_active = False
+        return True
+
+    def cancel_character(self, event=None):
+        self.character_selection_active = False
+        self.player_name = ""
+
+    def close_scores(self, event=None):
+        self.show_scores = False
+
+    def close_help(self, event=None):
+        self.show_help = False
+
+    def run(self, start_with_main_menu=True, splash=True):
         """
         Ejecuta el ciclo principal del menú del juego.
         Este método controla la lógica y la visualización del menú, incluyendo la pantalla de inicio,
@@ -276,6 +368,7 @@ class Menu:
         Args:
             start_with_main_menu (bool): Indica si se debe iniciar con el menú principal o directamente con la entrada de nombre.
                                          Por defecto es True.
+            splash (bool): Con el menú principal, muestra antes la pantalla de presentación. Por defecto es True.
         Returns:
             bool: Devuelve True si el jugador decide iniciar el juego, o False si el jugador decide salir.
         """
@@ -285,24 +378,46 @@ class Menu:
         self.input_name_active = False
         self.character_selection_active = False
         self.player_name = ""
-        if start_with_main_menu:
+        self.screen = None  # la partida pudo dibujar encima: la primera pantalla se dibuja completa
+        if start_with_main_menu and splash:
             self.show_splash = True
             self.splash_timer = pygame.time.get_ticks()
             self.splash_alpha = 255
-            self.play_music()  # Iniciar música al mostrar el menú
+            audio.play_music()  # Iniciar música al mostrar el menú
+        elif start_with_main_menu:
+            self.show_splash = False
+            self.fading_out = False
+            audio.play_music()  # Iniciar música al mostrar el menú
+            self.load_backgrounds()
         else:
             self.show_splash = False
             self.fading_out = False
             self.input_name_active = True
-            self.play_music()  # Iniciar música al mostrar el menú
+            audio.play_music()  # Iniciar música al mostrar el menú
+            self.load_backgrounds()
 
+        draw = {
+            'menu': self.draw_menu,
+            'name_input': self.draw_name_input,
+            'character_selection': self.draw_character_selection,
+            'scores': self.draw_scores,
+            'help': self.draw_help,
+        }
         while True:
+            result = events.dispatch(self.state)
+            if result is not None:
+                return result
+
             if self.show_splash:
                 current_time = pygame.time.get_ticks()
                 elapsed_time = current_time - self.splash_timer
+                # mientras se ve el splash se recogen las cargas; no se sale de él hasta que terminen
+                loader.poll()
+                if loader.finished:
+                    self.load_backgrounds()
 
                 if not self.fading_out:
-                    if elapsed_time >= self.splash_duration:
+                    if elapsed_time >= self.splash_duration and self.backgrounds_ready:
                         self.fading_out = True
                         self.fade_timer = pygame.time.get_ticks()
                     self.draw_splash()
@@ -316,62 +431,8 @@ class Menu:
                         self.fading_out = False
                         self.splash_alpha = 255
 
-                pygame.display.update()
+                self.present()
                 continue
 
-            if self.input_name_active:
-                result = self.handle_input_name()
-                if result is not None:
-                    if result:
-                        return True
-                    else:
-                        return False
-                self.draw_name_input()
-            elif self.character_selection_active:
-                result = self.handle_character_selection()
-                if result is not None:
-                    if result:
-                        return True
-                    else:
-                        continue
-                self.draw_character_selection()
-            elif self.show_scores:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        self.stop_music()
-                        return False
-                    if event.type == pygame.KEYDOWN:
-                        if event.key == pygame.K_ESCAPE:
-                            self.show_scores = False
-                self.draw_scores()
-            elif self.show_help:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        self.stop_music()
-                        return False
-                    if event.type == pygame.KEYDOWN:
-                        if event.key == pygame.K_ESCAPE:
-                            self.show_help = False
-                self.draw_help()
-            else:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        self.stop_music()
-                        return False
-                    if event.type == pygame.KEYDOWN:
-                        if event.key == pygame.K_UP or event.key == pygame.K_w:
-                            self.selected_option = (self.selected_option - 1) % len(self.options)
-                        if event.key == pygame.K_DOWN or event.key == pygame.K_s:
-                            self.selected_option = (self.selected_option + 1) % len(self.options)
-                        if event.key == pygame.K_RETURN:
-                            if self.options[self.selected_option] == 'Jugar':
-                                self.input_name_active = True
-                            elif self.options[self.selected_option] == 'Puntajes':
-                                self.show_scores = True
-                            elif self.options[self.selected_option] == 'Ayuda':
-                                self.show_help = True
-                            elif self.options[self.selected_option] == 'Salir':
-                                self.stop_music()
-                                return False
-                self.draw_menu()
-            pygame.display.update()
\ No newline at end of file
+            draw[self.state()]()
+            self.present()
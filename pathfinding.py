@@ -0,0 +1,158 @@
+from settings import *
+from collections import deque
+from heapq import heappush, heappop
+
+class FlowField:
+    def __init__(self, width, height, blocked_rects, clearance=(0, 0), tile_size=TILE_SIZE):
+        """
+        Campo de flujo sobre la rejilla de tiles del mapa, compartido por todos los enemigos.
+        Un Dijkstra desde el tile del jugador guarda en cada tile el vecino que está un paso más cerca
+        del jugador; cada enemigo solo consulta el de su tile y se dirige a su centro, en O(1).
+        Los tiles cuyo centro cae dentro de un obstáculo no se pueden pisar. Los tiles estrechos, donde
+        un rectángulo de 2 * clearance centrado en el tile tocaría un obstáculo, se pueden pisar pero
+        cuestan más, así el campo prefiere los pasos anchos por los que caben los enemigos grandes.
+        Args:
+            width (int): Ancho del mapa en tiles.
+            height (int): Alto del mapa en tiles.
+            blocked_rects (iterable): Rectángulos de los obstáculos, en píxeles.
+            clearance (tuple): Medio ancho y medio alto del rectángulo de colisión de los enemigos.
+            tile_size (int): Tamaño de un tile en píxeles.
+        Atributos:
+            blocked (list): Por tile, True si su centro está dentro de un obstáculo.
+            costs (list): Por tile, multiplicador del coste de entrar en él (1 libre, FLOW_TIGHT_COST estrecho).
+            centers (list): Centro en píxeles (pygame.Vector2) de cada tile.
+            around (list): Por tile, sus vecinos dentro del mapa.
+            links (list): Por tile libre, (vecino, coste) de cada paso permitido.
+            next_tiles (list): Por tile, el vecino hacia el que avanzar, o -1 si no hay camino.
+            target_tile (tuple): Tile (columna, fila) desde el que se calculó el campo.
+        """
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+        self.centers = [pygame.Vector2((col + 0.5) * tile_size, (row + 0.5) * tile_size)
+                        for row in range(height) for col in range(width)]
+        self.blocked = self.rasterize(blocked_rects, (0, 0))
+        self.costs = [FLOW_TIGHT_COST if tight else 1 for tight in self.rasterize(blocked_rects, clearance)]
+
+        offsets = [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+        self.around = []
+        self.links = []
+        for row in range(height):
+            for col in range(width):
+                self.around.append([(row + dy) * width + col + dx for dx, dy in offsets if self.inside(col + dx, row + dy)])
+                # pasos rectos valen 10 y diagonales 14, por el coste del tile de destino
+                self.links.append([((row + dy) * width + col + dx, (14 if dx and dy else 10) * self.costs[(row + dy) * width + col + dx])
+                                   for dx, dy in offsets if self.walkable_step(col, row, dx, dy)])
+        self.next_tiles = [-1] * (width * height)
+        self.target_tile = None
+
+    def rasterize(self, rects, clearance):
+        # marca los tiles cuyo centro cae dentro de algún rectángulo ampliado en 2 * clearance
+        tiles = [False] * (self.width * self.height)
+        for rect in rects:
+            rect = rect.inflate(2 * clearance[0], 2 * clearance[1])
+            for row in range(max(0, rect.top // self.tile_size), min(self.height, (rect.bottom - 1) // self.tile_size + 1)):
+                for col in range(max(0, rect.left // self.tile_size), min(self.width, (rect.right - 1) // self.tile_size + 1)):
+                    if rect.collidepoint(self.centers[row * self.width + col]):
+                        tiles[row * self.width + col] = True
+        return tiles
+
+    def tile_at(self, position):
+        return int(position[0] // self.tile_size), int(position[1] // self.tile_size)
+
+    def inside(self, col, row):
+        return 0 <= col < self.width and 0 <= row < self.height
+
+    def walkable_step(self, col, row, dx, dy):
+        # solo entre tiles libres, y un paso diagonal no puede cortar la esquina de un obstáculo
+        if self.blocked[row * self.width + col]:
+            return False
+        if not self.inside(col + dx, row + dy) or self.blocked[(row + dy) * self.width + col + dx]:
+            return False
+        if dx and dy:
+            return not self.blocked[row * self.width + col + dx] and not self.blocked[(row + dy) * self.width + col]
+        return True
+
+    def update(self, target_position):
+        """
+        Recalcula el campo hacia la posición objetivo, solo si cambió de tile.
+        Primero un Dijkstra por los tiles libres desde el tile del jugador (o, si está ocupado, desde
+        los tiles libres más cercanos). Después los tiles ocupados se enlazan con el tile alcanzado más
+        cercano, para que un enemigo metido en parte en un obstáculo salga de él.
+        Args:
+            target_position (tuple): Posición del jugador en píxeles.
+        Returns:
+            bool: True si se recalculó el campo.
+        """
+        target_tile = self.tile_at(target_position)
+        if target_tile == self.target_tile or not self.inside(*target_tile):
+            return False
+        self.target_tile = target_tile
+
+        blocked = self.blocked
+        links = self.links
+        next_tiles = [-1] * (self.width * self.height)
+        distances = [None] * (self.width * self.height)
+        seeds = [target_tile[1] * self.width + target_tile[0]]
+        if blocked[seeds[0]]:
+            seeds = self.nearest_free(seeds[0])
+        heap = []
+        for index in seeds:
+            distances[index] = 0
+            heap.append((0, index))
+        order = []
+        while heap:
+            distance, index = heappop(heap)
+            if distance > distances[index]:
+                continue
+            order.append(index)
+            for neighbour, cost in links[index]:
+                neighbour_distance = distance + cost
+                if distances[neighbour] is None or neighbour_distance < distances[neighbour]:
+                    distances[neighbour] = neighbour_distance
+                    next_tiles[neighbour] = index
+                    heappush(heap, (neighbour_distance, neighbour))
+
+        reached = [distance is not None for distance in distances]
+        queue = deque(order)
+        while queue:
+            index = queue.popleft()
+            for neighbour in self.around[index]:
+                if not reached[neighbour] and blocked[neighbour]:
+                    reached[neighbour] = True
+                    next_tiles[neighbour] = index
+                    queue.append(neighbour)
+        self.next_tiles = next_tiles
+        return True
+
+    def nearest_free(self, start):
+        # anillos alrededor de un tile ocupado hasta encontrar tiles libres; desde ellos se va en línea recta
+        seen = {start}
+        ring, free = [start], []
+        while ring and not free:
+            next_ring = []
+            for index in ring:
+                for neighbour in self.around[index]:
+                    if neighbour not in seen:
+                        seen.add(neighbour)
+                        (next_ring if self.blocked[neighbour] else free).append(neighbour)
+            ring = next_ring
+        return free
+
+    def direction_at(self, position):
+        """
+        Devuelve la dirección a seguir desde una posición en píxeles: hacia el centro del tile siguiente.
+        Returns:
+            pygame.Vector2 o None: Vector unitario, o None si la posición está en el tile del jugador,
+            fuera del mapa o sin camino.
+        """
+        col, row = self.tile_at(position)
+        if not self.inside(col, row):
+            return None
+        next_tile = self.next_tiles[row * self.width + col]
+        if next_tile < 0:
+            return None
+        direction = self.centers[next_tile] - position
+        if not direction:
+            return None
+        return direction.normalize()
@@ -1,7 +1,8 @@
 import pygame
-import os
 import random
 from settings import *
+from assets import assets
+import controls
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, position, groups, collision_sprites, drop_sprites, character="veronica"):
@@ -10,7 +11,7 @@ class Player(pygame.sprite.Sprite):
         Args:
             position (tuple): Coordenadas iniciales (x, y) del jugador.
             groups (iterable): Grupos de sprites a los que pertenece el jugador.
-            collision_sprites (iterable): Sprites con los que el jugador puede colisionar.
+            collision_sprites (CollisionSprites): Obstáculos con los que el jugador puede colisionar.
             drop_sprites (iterable): Sprites que el jugador puede soltar o interactuar.
             character (str, opcional): Nombre del personaje que se utilizará. Por defecto es "veronica".
         Atributos:
@@ -20,6 +21,7 @@ class Player(pygame.sprite.Sprite):
             image (Surface): Imagen inicial del jugador.
             rect (Rect): Rectángulo que define la posición del jugador.
             hitbox_rect (Rect): Rectángulo de colisión ajustado para el jugador.
+            hitbox_position (Vector2): Esquina superior izquierda de hitbox_rect sin redondear.
             direction (Vector2): Dirección del movimiento del jugador.
             speed (int): Velocidad del jugador.
             collision_sprites (iterable): Sprites con los que el jugador puede colisionar.
@@ -39,9 +41,11 @@ class Player(pygame.sprite.Sprite):
         self.character = character
         self.load_images()
         self.state, self.frame_index = 'down', 0
-        self.image = pygame.image.load(join('Resources', 'img', f'player{self.character.capitalize()}', 'down', '0.png')).convert_alpha()
+        self.image = self.frames['down'][0]
+        self.mask = assets.mask(self.image)
         self.rect = self.image.get_rect(center=position)
         self.hitbox_rect = self.rect.inflate(-60, -60)
+        self.hitbox_position = pygame.Vector2(self.hitbox_rect.topleft)
         self.direction = pygame.Vector2()
         self.speed = 500
         self.collision_sprites = collision_sprites
@@ -60,24 +64,22 @@ class Player(pygame.sprite.Sprite):
         # carga las imagenes a utilizar segun la direccion del personaje
         self.frames = {'left': [], 'right': [], 'up': [], 'down': []}
         for state in self.frames.keys():
-            for folder_path, sub_folders, file_names in walk(join('Resources', 'img', f'player{self.character.capitalize()}', state)):
-                if file_names:
-                    for file_name in sorted(file_names, key=lambda x: int(x.split('.')[0])):
-                        full_path = os.path.join(folder_path, file_name)
-                        surf = pygame.image.load(full_path).convert_alpha()
-                        self.frames[state].append(surf)
+            self.frames[state] = assets.frames(join('Resources', 'img', f'player{self.character.capitalize()}', state))
+            for frame in self.frames[state]:
+                assets.mask(frame)
 
     def input(self):
-        keys = pygame.key.get_pressed()
-        self.direction.x = int(keys[pygame.K_RIGHT] or keys[pygame.K_d]) - int(keys[pygame.K_LEFT] or keys[pygame.K_a])
-        self.direction.y = int(keys[pygame.K_DOWN] or keys[pygame.K_s]) - int(keys[pygame.K_UP] or keys[pygame.K_w])
+        self.direction = controls.movement()
         self.direction = self.direction.normalize() if self.direction else self.direction
 
     def move(self, dt):
-        # calcula el movimiento del personaje
-        self.hitbox_rect.x += self.direction.x * self.speed * dt
+        # calcula el movimiento del personaje; la posición se acumula en flotante, como en Enemy.move,
+        # para que con paso fijo el redondeo del rect no cambie la velocidad
+        self.hitbox_position.x += self.direction.x * self.speed * dt
+        self.hitbox_rect.x = round(self.hitbox_position.x)
         self.collision('horizontal')
-        self.hitbox_rect.y += self.direction.y * self.speed * dt
+        self.hitbox_position.y += self.direction.y * self.speed * dt
+        self.hitbox_rect.y = round(self.hitbox_position.y)
         self.collision('vertical')
         self.rect.center = self.hitbox_rect.center
 
@@ -92,19 +94,22 @@ class Player(pygame.sprite.Sprite):
             - Si la dirección es 'vertical', ajusta la posición del rectángulo de colisión del jugador
               (hitbox_rect) para evitar superposiciones con los sprites en la dirección y.
         Notas:
+            - Solo se revisan los obstáculos cercanos devueltos por el índice espacial (`collision_sprites.nearby`).
             - La detección de colisiones se realiza utilizando el método `colliderect` de los rectángulos.
             - La posición del rectángulo de colisión del jugador se ajusta dependiendo de la dirección
               del movimiento (positiva o negativa) en los ejes x o y.
         """
         
-        for sprite in self.collision_sprites:
+        for sprite in self.collision_sprites.nearby(self.hitbox_rect):
             if sprite.rect.colliderect(self.hitbox_rect):
                 if direction == 'horizontal':
                     if self.direction.x > 0: self.hitbox_rect.right = sprite.rect.left
                     if self.direction.x < 0: self.hitbox_rect.left = sprite.rect.right
+                    self.hitbox_position.x = self.hitbox_rect.x
                 else:
                     if self.direction.y > 0: self.hitbox_rect.bottom = sprite.rect.top
                     if self.direction.y < 0: self.hitbox_rect.top = sprite.rect.bottom
+                    self.hitbox_position.y = self.hitbox_rect.y
 
     def animate(self, dt):
         if self.direction.x != 0:
@@ -113,6 +118,7 @@ class Player(pygame.sprite.Sprite):
             self.state = 'down' if self.direction.y > 0 else 'up'
         self.frame_index = self.frame_index + 5 * dt if self.direction else 0
         self.image = self.frames[self.state][int(self.frame_index) % len(self.frames[self.state])]
+        self.mask = assets.mask(self.image)
 
     def reset_flashlight(self):
         self.light_timer = self.light_duration
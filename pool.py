@@ -0,0 +1,55 @@
+from settings import *
+
+class SpritePool:
+    def __init__(self, factory, max_size=POOL_MAX_SIZE):
+        """
+        Pool de sprites reutilizables de un tipo (balas, enemigos, drops).
+        acquire() devuelve una instancia libre reiniciada con spawn(), o crea una nueva si no hay;
+        el kill() del sprite la devuelve al pool con release(). Así no se crean y descartan objetos
+        en cada disparo, aparición o muerte.
+        Args:
+            factory (type): Clase del sprite; su __init__ y su spawn() reciben los mismos argumentos.
+            max_size (int): Instancias libres que se guardan como máximo; el resto se descarta.
+        Atributos:
+            free (list): Instancias libres, listas para reutilizar.
+            created (int): Instancias creadas porque no había ninguna libre.
+            reused (int): Veces que acquire() reutilizó una instancia libre.
+            discarded (int): Instancias devueltas con el pool lleno.
+        """
+        self.factory = factory
+        self.max_size = max_size
+        self.free = []
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+
+    def acquire(self, *args):
+        if self.free:
+            sprite = self.free.pop()
+            sprite.spawn(*args)
+            self.reused += 1
+        else:
+            sprite = self.factory(*args)
+            sprite.pool = self
+            self.created += 1
+        return sprite
+
+    def release(self, sprite):
+        if len(self.free) < self.max_size:
+            self.free.append(sprite)
+        else:
+            self.discarded += 1
+
+    def stats(self):
+        """
+        Returns:
+            dict: Instancias libres, creadas, reutilizadas, descartadas y tasa de acierto (0 a 1).
+        """
+        requests = self.created + self.reused
+        return {
+            'size': len(self.free),
+            'created': self.created,
+            'reused': self.reused,
+            'discarded': self.discarded,
+            'hit_rate': self.reused / requests if requests else 0.0,
+        }
@@ -0,0 +1,190 @@
+from settings import *
+from hud import text_cache
+from collections import deque
+import json
+import time
+
+class NullPhase:
+    # contexto vacío que se usa cuando el perfilador está apagado
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+class Phase:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        self.profiler.record(self.name, self.start, time.perf_counter())
+        return False
+
+class FrameProfiler:
+    def __init__(self, window=PROFILER_WINDOW, trace_frames=PROFILER_TRACE_FRAMES, table_refresh=PROFILER_TABLE_REFRESH):
+        """
+        Perfilador por fases del bucle de juego.
+        Cada fotograma se abre con begin_frame() y se cierra con end_frame(); entre medio, cada
+        fase se mide con `with profiler.phase('nombre'):`. Apagado, phase() devuelve un contexto
+        vacío compartido y no mide nada. El propio panel se mide como fase 'overlay'.
+        Args:
+            window (int): Fotogramas que se usan para los percentiles y la gráfica.
+            trace_frames (int): Fotogramas recientes que se guardan para exportar la traza.
+            table_refresh (float): Segundos entre recálculos de la tabla de percentiles del panel.
+        Atributos:
+            enabled (bool): Indica si se está midiendo y mostrando el panel.
+            history (deque): (duración del fotograma, {fase: segundos}) de los últimos fotogramas.
+            trace (deque): Fotogramas recientes como listas de (nombre, inicio, fin) para Chrome trace.
+            table (pygame.Surface): Fondo del panel con la tabla ya dibujada (None = hay que rehacerla).
+            table_time (float): Momento (perf_counter) en que se dibujó la tabla.
+        """
+        self.enabled = False
+        self.history = deque(maxlen=window)
+        self.trace = deque(maxlen=trace_frames)
+        self.null_phase = NullPhase()
+        self.font = None
+        self.frame_start = 0.0
+        self.current = {}
+        self.current_events = []
+        self.table_refresh = table_refresh
+        self.graph_height = 60
+        self.table = None
+        self.table_time = 0.0
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.history.clear()
+        self.trace.clear()
+        self.frame_start = 0.0
+        self.table = None
+
+    def phase(self, name):
+        if not self.enabled:
+            return self.null_phase
+        return Phase(self, name)
+
+    def record(self, name, start, end):
+        self.current[name] = self.current.get(name, 0.0) + end - start
+        self.current_events.append((name, start, end))
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.frame_start = time.perf_counter()
+        self.current = {}
+        self.current_events = []
+
+    def end_frame(self):
+        if not self.enabled or not self.frame_start:
+            return
+        frame_end = time.perf_counter()
+        self.history.append((frame_end - self.frame_start, self.current))
+        self.current_events.append(('frame', self.frame_start, frame_end))
+        self.trace.append(self.current_events)
+
+    @staticmethod
+    def percentile(ordered, fraction):
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def summary(self):
+        """
+        Calcula p50, p95 y p99 en milisegundos de cada fase y del fotograma completo.
+        Returns:
+            dict: nombre -> (p50, p95, p99), con 'frame' al final.
+        """
+        names = []
+        for _, phases in self.history:
+            for name in phases:
+                if name not in names:
+                    names.append(name)
+        result = {}
+        for name in names + ['frame']:
+            if name == 'frame':
+                values = sorted(frame_time for frame_time, _ in self.history)
+            else:
+                values = sorted(phases.get(name, 0.0) for _, phases in self.history)
+            if values:
+                result[name] = tuple(1000 * self.percentile(values, fraction) for fraction in (0.5, 0.95, 0.99))
+        return result
+
+    def draw_table(self, summary):
+        """
+        Dibuja el fondo del panel con la tabla de percentiles por fase.
+        Los nombres y encabezados se repiten en cada recálculo y salen de text_cache; los números
+        cambian cada vez y se renderizan directamente para no llenar la caché de textos de un solo uso.
+        Args:
+            summary (dict): Resultado de summary().
+        Returns:
+            pygame.Surface: Panel con la tabla y el hueco de la gráfica.
+        """
+        line_height = 18
+        table = pygame.Surface((320, 30 + line_height * (len(summary) + 1) + self.graph_height)).convert()
+        table.fill((0, 0, 0))
+        columns = [8, 150, 205, 260]
+        y = 6
+        for column, text in zip(columns, ['fase (ms)', 'p50', 'p95', 'p99']):
+            table.blit(text_cache.render(self.font, text, (255, 255, 0)), (column, y))
+        for name, values in summary.items():
+            y += line_height
+            table.blit(text_cache.render(self.font, name), (columns[0], y))
+            for column, value in zip(columns[1:], values):
+                table.blit(self.font.render(f"{value:.2f}", True, (255, 255, 255)), (column, y))
+        return table
+
+    def draw(self, surface):
+        """
+        Dibuja el panel con los percentiles por fase y la gráfica de tiempos de fotograma.
+        La tabla se recalcula cada `table_refresh` segundos; la gráfica, en cada fotograma.
+        Args:
+            surface (pygame.Surface): Superficie destino (normalmente la pantalla).
+        """
+        if not self.enabled or not self.history:
+            return
+        with self.phase('overlay'):
+            if self.font is None:
+                self.font = pygame.font.Font(None, 22)
+            now = time.perf_counter()
+            if self.table is None or now - self.table_time >= self.table_refresh:
+                self.table = self.draw_table(self.summary())
+                self.table_time = now
+            panel = surface.blit(self.table, (WINDOW_WIDTH - 330, 10))
+
+            # gráfica: una barra por fotograma, con una línea de referencia en 16.7 ms (60 FPS)
+            graph = pygame.Rect(panel.left + 8, panel.bottom - self.graph_height - 8, panel.width - 16, self.graph_height)
+            scale = self.graph_height / 33.3
+            bar_width = graph.width / self.history.maxlen
+            for index, (frame_time, _) in enumerate(self.history):
+                bar_height = min(self.graph_height, 1000 * frame_time * scale)
+                color = (0, 255, 0) if frame_time <= 1 / 60 else (255, 0, 0)
+                pygame.draw.rect(surface, color, (graph.left + index * bar_width, graph.bottom - bar_height, max(1, bar_width), bar_height))
+            reference_y = graph.bottom - 16.7 * scale
+            pygame.draw.line(surface, (255, 255, 0), (graph.left, reference_y), (graph.right, reference_y))
+
+    def export_trace(self, path):
+        """
+        Guarda los fotogramas recientes en formato Chrome trace (chrome://tracing o Perfetto).
+        Args:
+            path (str): Ruta del archivo JSON.
+        Returns:
+            int: Número de eventos exportados.
+        """
+        events = []
+        for frame_events in self.trace:
+            for name, start, end in frame_events:
+                events.append({
+                    'name': name,
+                    'cat': 'frame' if name == 'frame' else 'phase',
+                    'ph': 'X',
+                    'ts': start * 1e6,
+                    'dur': (end - start) * 1e6,
+                    'pid': 1,
+                    'tid': 1,
+                })
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        return len(events)
@@ -0,0 +1,172 @@
+from settings import *
+from bisect import insort
+from datetime import datetime
+from queue import Queue
+from threading import Thread
+import atexit
+import json
+import os
+
+class ScoreStore:
+    def __init__(self, path, legacy_path=None):
+        """
+        Historial de puntajes en un registro de solo añadido (una línea JSON por partida).
+        Cada puntaje nuevo entra al instante en los índices en memoria y se escribe al final del
+        archivo desde un hilo aparte con flush + fsync, así guardar nunca detiene un fotograma.
+        Si el juego se cierra a mitad de una escritura, lo más que queda es una última línea
+        cortada, que se ignora al leer; la compactación reescribe el registro en un archivo
+        temporal y lo cambia de una vez con os.replace, de modo que el archivo siempre está
+        completo en su versión vieja o en la nueva.
+        Args:
+            path (str): Ruta del registro (JSONL).
+            legacy_path (str, opcional): scores.json antiguo; si el registro no existe aún, sus
+                                         puntajes se importan en él.
+        Atributos:
+            history (list): Puntajes en el orden en que se jugaron; es lo que escribe la compactación.
+            ranking (list): Puntajes de mayor a menor (a igual puntaje, el más antiguo primero).
+            by_player (dict): Nombre -> sus puntajes, también de mayor a menor.
+            seen (set): (puntaje, nombre, fecha) ya guardados, para no repetir entradas.
+            writes (Queue): Líneas y compactaciones pendientes para el hilo de escritura.
+        """
+        self.path = path
+        self.history = []
+        self.ranking = []
+        self.by_player = {}
+        self.seen = set()
+        self.writes = Queue()
+        self.writer = Thread(target=self.write_loop, name='scores', daemon=True)
+        self.writer.start()
+        atexit.register(self.close)
+
+        if os.path.exists(path):
+            wasted = self.load()
+        else:
+            wasted = self.migrate(legacy_path)
+        if wasted:
+            self.compact()
+
+    @staticmethod
+    def valid(entry):
+        return (isinstance(entry, dict) and 'name' in entry and 'score' in entry and 'date' in entry and
+                isinstance(entry['score'], (int, float)))
+
+    @staticmethod
+    def order(entry):
+        return (-entry['score'], entry['date'], entry['name'])
+
+    def index(self, entry):
+        # añade a los índices; devuelve False si la entrada ya estaba
+        entry_tuple = (entry['score'], entry['name'], entry['date'])
+        if entry_tuple in self.seen:
+            return False
+        self.seen.add(entry_tuple)
+        self.history.append(entry)
+        insort(self.ranking, entry, key=self.order)
+        insort(self.by_player.setdefault(entry['name'], []), entry, key=self.order)
+        return True
+
+    def load(self):
+        """
+        Lee el registro completo y construye los índices.
+        Returns:
+            int: Líneas desechadas (cortadas, inválidas o repetidas), que la compactación elimina.
+        """
+        wasted = 0
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.endswith('\n'):
+                        # última línea sin terminar: lo siguiente que se añada quedaría pegado a ella
+                        wasted += 1
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        wasted += 1
+                        continue
+                    if not self.valid(entry) or not self.index(entry):
+                        wasted += 1
+        except OSError as e:
+            print(f"Error al cargar puntajes: {e}, inicializando lista vacía")
+        return wasted
+
+    def migrate(self, legacy_path):
+        # importa los puntajes del scores.json antiguo; devuelve cuántos hay que escribir en el registro
+        if not legacy_path:
+            return 0
+        try:
+            with open(legacy_path, 'r', encoding='utf-8') as f:
+                scores = json.load(f)
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError) as e:
+            print(f"Error al cargar puntajes: {e}, inicializando lista vacía")
+            return 0
+        if not isinstance(scores, list):
+            return 0
+        return sum(1 for entry in scores if self.valid(entry) and self.index(entry))
+
+    def add(self, name, score):
+        """
+        Registra el puntaje de una partida terminada.
+        Args:
+            name (str): Nombre del jugador.
+            score (float): Puntaje; se guarda como entero.
+        Returns:
+            dict: La entrada guardada.
+        """
+        entry = {'name': name, 'score': int(score), 'date': datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+        if self.index(entry):
+            self.writes.put(('append', json.dumps(entry)))
+        return entry
+
+    def top(self, count=SCORE_TOP):
+        return self.ranking[:count]
+
+    def player(self, name, count=None):
+        # puntajes de un jugador, de mayor a menor
+        scores = self.by_player.get(name, [])
+        return scores[:count] if count is not None else list(scores)
+
+    def compact(self):
+        # reescribe el registro solo con las entradas válidas; el hilo de escritura hace el trabajo
+        self.writes.put(('compact', [json.dumps(entry) for entry in self.history]))
+
+    def write_loop(self):
+        # hilo de escritura: atiende las peticiones en orden, así una compactación incluye todo lo añadido antes
+        while True:
+            action, data = self.writes.get()
+            try:
+                if action == 'append':
+                    self.append(data)
+                elif action == 'compact':
+                    self.rewrite(data)
+            except OSError as e:
+                print(f"Error al guardar puntajes: {e}")
+            finally:
+                self.writes.task_done()
+            if action == 'stop':
+                return
+
+    def append(self, line):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def rewrite(self, lines):
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.writelines(line + '\n' for line in lines)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+    def flush(self):
+        # espera a que estén en disco todas las escrituras pedidas hasta ahora
+        self.writes.join()
+
+    def close(self):
+        if self.writer.is_alive():
+            self.writes.put(('stop', None))
+            self.writer.join()
+
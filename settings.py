@@ -3,4 +3,82 @@ from os.path import join
 from os import walk
 
 WINDOW_WIDTH, WINDOW_HEIGHT = 1280, 720
-TILE_SIZE = 64
\ No newline at end of file
+TILE_SIZE = 64
+
+# Renderizado del suelo por bloques pre-dibujados (False usa un sprite por tile)
+GROUND_CHUNKS = True
+CHUNK_SIZE = 8  # tiles por lado de cada bloque
+
+# Presupuesto de memoria para la caché compartida de imágenes (ver assets.py)
+ASSET_CACHE_BUDGET = 96 * 1024 * 1024
+
+# Resolución angular (grados) de los fotogramas precalculados del arma
+GUN_ANGLE_STEP = 2
+
+# Iluminación: paso de redondeo del radio, ancho del degradado del borde (0 = borde duro) y parches en caché
+LIGHT_RADIUS_STEP = 2
+LIGHT_FALLOFF = 0
+LIGHT_CACHE_SIZE = 32
+
+# Niebla: divisor de resolución con el que se genera el ruido y textura de ruido (False usa gris plano)
+FOG_SCALE = 2
+FOG_NOISE = True
+
+# Bucle de juego: paso fijo de simulación, límite de FPS de dibujo (0 = sin límite) y tiempo máximo simulado por fotograma
+FIXED_DT = 1 / 60
+MAX_FPS = 120
+MAX_FRAME_TIME = 0.25
+
+# Perfilador en pantalla (F3): fotogramas para percentiles y gráfica, fotogramas guardados para la traza (F4)
+# y segundos entre actualizaciones de la tabla del panel
+PROFILER_WINDOW = 240
+PROFILER_TRACE_FRAMES = 600
+PROFILER_TABLE_REFRESH = 0.25
+
+# Campo de flujo de los enemigos: multiplicador de coste de los tiles estrechos, donde no cabe el enemigo más grande
+FLOW_TIGHT_COST = 3
+
+# Enemigos por lotes con NumPy (si está instalado; opcional, su colisión por celdas es menos precisa
+# que la de cada sprite) y lado en píxeles de las celdas de su mapa de obstáculos
+ENEMY_BATCH = False
+BATCH_CELL_SIZE = 4
+
+# Instancias libres que guarda como máximo cada pool de sprites (balas, enemigos y drops)
+POOL_MAX_SIZE = 256
+
+# Hilos que leen y decodifican imágenes y sonidos en segundo plano (ver loader.py)
+LOADER_WORKERS = 4
+
+# Ancho máximo en píxeles de los atlas de fotogramas (ver atlas.py)
+ATLAS_MAX_WIDTH = 1024
+
+# Puntajes que se muestran en el menú (el registro guarda el historial completo, ver scores.py)
+SCORE_TOP = 5
+# Registro de puntajes y scores.json antiguo que se importa si el registro aún no existe
+SCORE_LOG_PATH = join('Resources', 'scores.log')
+SCORE_LEGACY_PATH = join('Resources', 'scores.json')
+
+# Textos renderizados que guarda la caché del HUD y los menús (ver hud.py)
+TEXT_CACHE_SIZE = 128
+
+# Fotogramas por segundo máximos de los menús; con el límite el menú en reposo casi no usa CPU
+MENU_FPS = 60
+
+# Oleadas de enemigos (ver spawner.py): lado de las celdas del índice de puntos de aparición, descanso en
+# segundos entre oleadas, enemigos extra por oleada y enemigos simultáneos extra por tipo en cada nivel de dificultad
+SPAWN_CELL_SIZE = TILE_SIZE * 4
+SPAWN_WAVE_REST = 5
+SPAWN_WAVE_GROWTH = 5
+SPAWN_CAP_PER_LEVEL = 1
+
+# Canales del mezclador reservados para cada grupo de sonidos (ver audio.py)
+AUDIO_CHANNEL_GROUPS = {'weapons': 3, 'impacts': 4}
+# Canales sin reservar para los sonidos que se reproducen fuera de AudioManager
+AUDIO_FREE_CHANNELS = 2
+
+# Informe de memoria (ver memory.py): segundos entre informes (0 = desactivado), archivo, diferencias de
+# tracemalloc (más lento) y cuántas líneas de esas diferencias se escriben
+MEMORY_REPORT_INTERVAL = 300
+MEMORY_REPORT_PATH = 'memory-report.log'
+MEMORY_TRACEMALLOC = False
+MEMORY_TRACE_TOP = 5
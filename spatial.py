@@ -0,0 +1,86 @@
+from settings import *
+
+class SpatialHash:
+    def __init__(self, cell_size=TILE_SIZE):
+        """
+        Índice espacial por celdas de tamaño fijo.
+        Cada sprite se guarda en todas las celdas que toca su rect, de modo que una consulta
+        solo revisa los sprites de las celdas que cubre el rectángulo consultado.
+        Args:
+            cell_size (int): Tamaño en píxeles de cada celda. Por defecto el tamaño de un tile.
+        """
+        self.cell_size = cell_size
+        self.cells = {}  # (columna, fila) -> lista de sprites
+
+    def cell_range(self, rect):
+        # devuelve las celdas (columna, fila) que cubre un rectángulo
+        first_col = rect.left // self.cell_size
+        last_col = (rect.right - 1) // self.cell_size
+        first_row = rect.top // self.cell_size
+        last_row = (rect.bottom - 1) // self.cell_size
+        return [(col, row) for row in range(first_row, last_row + 1) for col in range(first_col, last_col + 1)]
+
+    def clear(self):
+        self.cells.clear()
+
+    def insert(self, sprite):
+        for cell in self.cell_range(sprite.rect):
+            self.cells.setdefault(cell, []).append(sprite)
+
+    def query(self, rect):
+        """
+        Devuelve los sprites de las celdas que cubre el rectángulo, sin repetidos y en orden de inserción.
+        No comprueba la intersección exacta: eso queda a cargo de quien consulta (colliderect, máscaras...).
+        Args:
+            rect (pygame.Rect): Rectángulo a consultar en coordenadas del mundo.
+        Returns:
+            list: Sprites candidatos cercanos al rectángulo.
+        """
+        found = {}
+        for cell in self.cell_range(rect):
+            for sprite in self.cells.get(cell, ()):
+                found[sprite] = None
+        return list(found)
+
+
+class BroadPhase:
+    def __init__(self, cell_size=TILE_SIZE * 2):
+        """
+        Fase amplia de colisiones para sprites que se mueven (enemigos).
+        Se reconstruye en cada tick con rebuild() y candidates() devuelve solo los sprites que
+        comparten celda con el sprite consultado, para pasar menos pares a la prueba por máscara.
+        Atributos:
+            pairs_tested (int): Pares entregados a la fase fina desde el último rebuild().
+            pairs_pruned (int): Pares descartados por no compartir celda desde el último rebuild().
+        """
+        self.grid = SpatialHash(cell_size)
+        self.count = 0
+        self.pairs_tested = 0
+        self.pairs_pruned = 0
+
+    def rebuild(self, sprites):
+        # vuelve a indexar los sprites en sus posiciones actuales y reinicia los contadores
+        self.grid.clear()
+        self.count = 0
+        for sprite in sprites:
+            self.grid.insert(sprite)
+            self.count += 1
+        self.pairs_tested = 0
+        self.pairs_pruned = 0
+
+    def candidates(self, sprite):
+        found = self.grid.query(sprite.rect)
+        self.pairs_tested += len(found)
+        self.pairs_pruned += self.count - len(found)
+        return found
+
+    def collide(self, sprite, collided=pygame.sprite.collide_mask):
+        """
+        Equivalente a pygame.sprite.spritecollide(sprite, grupo, False, collided) restringido a los candidatos.
+        Args:
+            sprite (pygame.sprite.Sprite): Sprite a probar (bala, jugador...).
+            collided (callable): Prueba de la fase fina. Por defecto colisión por máscara.
+        Returns:
+            list: Sprites indexados que colisionan con el sprite.
+        """
+        return [other for other in self.candidates(sprite) if collided(sprite, other)]
@@ -0,0 +1,116 @@
+from settings import *
+from random import choice, choices
+
+# oleadas en orden: peso de cada tipo de enemigo, enemigos de la oleada en el nivel 0 de dificultad
+# y segundos entre apariciones; al terminar la lista se repite la última
+WAVES = [
+    {'types': {'ghost': 2, 'bat': 1, 'skeleton': 1}, 'size': 20, 'interval': 0.5},
+    {'types': {'ghost': 1, 'bat': 1, 'skeleton': 1}, 'size': 30, 'interval': 0.5},
+    {'types': {'ghost': 1, 'bat': 2, 'skeleton': 2}, 'size': 40, 'interval': 0.4},
+]
+
+class SpawnScheduler:
+    def __init__(self, waves=WAVES, cell_size=SPAWN_CELL_SIZE):
+        """
+        Planificador de apariciones de enemigos por oleadas.
+        Cada oleada reparte un presupuesto de enemigos (mayor con cada nivel de dificultad) a un
+        ritmo fijo (más rápido con cada nivel) y, al agotarlo, hay un descanso de SPAWN_WAVE_REST
+        segundos antes de la siguiente. Solo se encola una aparición si su tipo tiene hueco bajo el
+        límite de enemigos simultáneos; si ninguno lo tiene, el reloj espera a que muera alguno en
+        lugar de generar y descartar intentos.
+        Los puntos de aparición se indexan por celdas para elegir, sin recorrerlos todos, uno fuera
+        de la cámara, donde el jugador no vea aparecer al enemigo.
+        Args:
+            waves (list): Definición de las oleadas, como WAVES.
+            cell_size (int): Lado en píxeles de las celdas del índice de puntos de aparición.
+        Atributos:
+            positions (list): Puntos de aparición.
+            cells (dict): (columna, fila) -> puntos de aparición de esa celda.
+            outside (dict): Celdas que cubre la cámara -> puntos de las celdas que no cubre; a lo
+                            sumo una entrada por posición de la cámara en la rejilla.
+            wave (int): Número de oleada actual, desde 0.
+            remaining (int): Enemigos que faltan por aparecer en la oleada (None antes de empezarla).
+            timer (float): Segundos hasta la próxima aparición.
+            rest (float): Segundos de descanso que quedan antes de la próxima oleada.
+        """
+        self.waves = waves
+        self.cell_size = cell_size
+        self.positions = []
+        self.cells = {}
+        self.outside = {}
+        self.reset()
+
+    def set_positions(self, positions):
+        # construye el índice de puntos de aparición
+        self.positions = list(positions)
+        self.cells = {}
+        for position in self.positions:
+            self.cells.setdefault((int(position[0]) // self.cell_size, int(position[1]) // self.cell_size), []).append(position)
+        self.outside = {}
+
+    def reset(self):
+        self.wave = 0
+        self.remaining = None
+        self.timer = 0.0
+        self.rest = 0.0
+
+    def position(self, camera_rect):
+        """
+        Elige un punto de aparición al azar, preferiblemente en una celda que la cámara no cubre.
+        Args:
+            camera_rect (pygame.Rect): Área visible en coordenadas del mundo.
+        Returns:
+            tuple: Punto de aparición.
+        """
+        key = (camera_rect.left // self.cell_size, camera_rect.top // self.cell_size,
+               (camera_rect.right - 1) // self.cell_size, (camera_rect.bottom - 1) // self.cell_size)
+        outside = self.outside.get(key)
+        if outside is None:
+            outside = self.outside[key] = [
+                position for (col, row), positions in self.cells.items()
+                if not (key[0] <= col <= key[2] and key[1] <= row <= key[3])
+                for position in positions
+            ]
+        return choice(outside or self.positions)
+
+    def update(self, dt, difficulty_level, enemies_active, cap, camera_rect):
+        """
+        Avanza el reloj de la oleada y devuelve las apariciones que tocan en este paso.
+        Args:
+            dt (float): Segundos del paso.
+            difficulty_level (int): Nivel de dificultad actual.
+            enemies_active (dict): Tipo de enemigo -> enemigos vivos de ese tipo.
+            cap (int): Enemigos simultáneos permitidos por tipo.
+            camera_rect (pygame.Rect): Área visible, para aparecer fuera de ella.
+        Returns:
+            list: (tipo de enemigo, punto de aparición) a generar ahora.
+        """
+        if self.rest > 0:
+            self.rest -= dt
+            return []
+        wave = self.waves[min(self.wave, len(self.waves) - 1)]
+        if self.remaining is None:
+            self.remaining = wave['size'] + SPAWN_WAVE_GROWTH * difficulty_level
+        interval = wave['interval'] / (1 + 0.1 * difficulty_level)
+
+        spawns = []
+        queued = dict.fromkeys(wave['types'], 0)
+        self.timer -= dt
+        while self.timer <= 0 and self.remaining > 0:
+            available = [enemy_type for enemy_type in wave['types'] if enemies_active[enemy_type] + queued[enemy_type] < cap]
+            if not available:
+                # todos los tipos están al límite: se espera a la próxima muerte sin acumular retraso
+                self.timer = 0.0
+                break
+            enemy_type = choices(available, [wave['types'][enemy_type] for enemy_type in available])[0]
+            queued[enemy_type] += 1
+            spawns.append((enemy_type, self.position(camera_rect)))
+            self.remaining -= 1
+            self.timer += interval
+
+        if self.remaining == 0:
+            self.wave += 1
+            self.remaining = None
+            self.timer = 0.0
+            self.rest = SPAWN_WAVE_REST
+        return spawns
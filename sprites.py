@@ -1,8 +1,9 @@
 from settings import *
-from math import atan2, degrees
+from math import atan2, degrees, floor, ceil
 import pygame
 import random
-from drop import Drop
+from assets import assets
+import controls
 
 class Sprite(pygame.sprite.Sprite):
     def __init__(self, position, surface, groups):
@@ -23,14 +24,31 @@ class Gun(pygame.sprite.Sprite):
         self.distance = 140
         self.player_direction = pygame.Vector2(0, 1)
         super().__init__(groups)
-        self.gun_surface = pygame.image.load(join('Resources', 'img', 'gun', 'gun.png')).convert_alpha()
+        self.gun_path = join('Resources', 'img', 'gun', 'gun.png')
+        self.gun_surface = assets.image(self.gun_path)
+        self.angle_step = GUN_ANGLE_STEP
+        self.load_rotations()
+        self.rotation_key = None
         self.image = self.gun_surface
         self.rect = self.image.get_rect(center=self.player.rect.center + self.player_direction * self.distance)
+
+    def load_rotations(self):
+        """
+        Precalcula los fotogramas rotados del arma cada `angle_step` grados.
+        Hacia la derecha el ángulo va de -90 a 90 grados sin volteo; hacia la izquierda se usa
+        el valor absoluto del ángulo (90 a 270 grados) con volteo vertical, igual que rotate_gun().
+        Los fotogramas salen del registro de assets, así que solo se calculan la primera vez.
+        """
+        self.rotation_frames = {}
+        for flipped, low, high in [(False, -90, 90), (True, 90, 270)]:
+            for step_index in range(floor(low / self.angle_step), ceil(high / self.angle_step) + 1):
+                angle = step_index * self.angle_step
+                self.rotation_frames[(angle, flipped)] = assets.image(self.gun_path, rotation=angle, flip=(False, flipped))
         
     def get_direction(self):
         """
         Calcula la dirección del jugador hacia la posición del mouse.
-        Utiliza las coordenadas actuales del mouse y la posición central del jugador
+        Utiliza las coordenadas actuales del mouse (o del guion activo en `controls`) y la posición central del jugador
         en la ventana para determinar un vector de dirección. Si el vector tiene una
         longitud mayor a cero, se normaliza para obtener una dirección unitaria.
         Atributos modificados:
@@ -41,7 +59,7 @@ class Gun(pygame.sprite.Sprite):
         - pygame debe estar correctamente inicializado y el mouse debe estar activo.
         """
         
-        mouse_pos = pygame.Vector2(pygame.mouse.get_pos())
+        mouse_pos = pygame.Vector2(controls.aim_position())
         player_pos = pygame.Vector2(WINDOW_WIDTH / 2, WINDOW_HEIGHT / 2)
         direction_vector = mouse_pos - player_pos
         if direction_vector.length() > 0:
@@ -53,13 +71,13 @@ class Gun(pygame.sprite.Sprite):
         Calcula el ángulo de rotación basado en la dirección del jugador 
         utilizando la función atan2 y lo ajusta con un desplazamiento de -90 grados 
         para alinear correctamente la imagen del arma. Si la dirección en el eje x 
-        es positiva, rota la imagen normalmente. Si la dirección en el eje x es negativa, 
-        rota la imagen con el valor absoluto del ángulo y luego invierte la imagen verticalmente.
+        es positiva, usa la imagen rotada normalmente. Si la dirección en el eje x es negativa, 
+        usa la imagen rotada con el valor absoluto del ángulo e invertida verticalmente.
+        El ángulo se redondea a múltiplos de `angle_step` y la imagen se toma de los
+        fotogramas precalculados en load_rotations(); solo cambia si cambia el ángulo redondeado.
         Modifica:
             self.image: Actualiza la imagen del arma con la rotación y/o inversión aplicadas.
         Dependencias:
-            - pygame.transform.rotozoom: Para rotar y escalar la imagen.
-            - pygame.transform.flip: Para invertir la imagen verticalmente.
             - math.degrees: Para convertir el ángulo de radianes a grados.
             - math.atan2: Para calcular el ángulo basado en las coordenadas x e y.
         Variables:
@@ -67,11 +85,13 @@ class Gun(pygame.sprite.Sprite):
         """
         
         angle = degrees(atan2(self.player_direction.x, self.player_direction.y)) - 90
-        if self.player_direction.x > 0:
-            self.image = pygame.transform.rotozoom(self.gun_surface, angle, 1)
-        else:
-            self.image = pygame.transform.rotozoom(self.gun_surface, abs(angle), 1)
-            self.image = pygame.transform.flip(self.image, False, True)
+        flipped = self.player_direction.x <= 0
+        if flipped:
+            angle = abs(angle)
+        rotation_key = (round(angle / self.angle_step) * self.angle_step, flipped)
+        if rotation_key != self.rotation_key:
+            self.rotation_key = rotation_key
+            self.image = self.rotation_frames[rotation_key]
         
     def update(self, _):
         self.get_direction()
@@ -80,17 +100,32 @@ class Gun(pygame.sprite.Sprite):
 
 class Bullet(pygame.sprite.Sprite):
     def __init__(self, surface, position, direction, groups):
-        super().__init__(groups)
+        super().__init__()
+        self.pool = None
+        self.lifetime = 1000
+        self.speed = 1200
+        self.spawn(surface, position, direction, groups)
+
+    def spawn(self, surface, position, direction, groups):
+        # estado de cada disparo; el pool lo llama de nuevo al reutilizar la bala
         self.image = surface
+        self.mask = assets.mask(surface)
         self.rect = self.image.get_rect(center=position)
-        self.spawn_time = pygame.time.get_ticks()
-        self.lifetime = 1000
+        self.age = 0
         self.direction = direction
-        self.speed = 1200
+        self.add(groups)
+
+    def kill(self):
+        if self.alive():
+            super().kill()
+            if self.pool:
+                self.pool.release(self)
         
     def update(self, dt):
+        # la vida de la bala se mide en tiempo simulado para que no dependa de la velocidad del equipo
         self.rect.center += self.direction * self.speed * dt
-        if pygame.time.get_ticks() - self.spawn_time > self.lifetime:
+        self.age += dt * 1000
+        if self.age > self.lifetime:
             self.kill()
 
 class Enemy(pygame.sprite.Sprite):
@@ -102,7 +137,7 @@ class Enemy(pygame.sprite.Sprite):
             frames (list): Lista de fotogramas para la animación del enemigo.
             groups (pygame.sprite.Group): Grupos de sprites a los que pertenece el enemigo.
             player (Player): Referencia al jugador para calcular daño y otras interacciones.
-            collision_sprites (pygame.sprite.Group): Grupo de sprites con los que el enemigo puede colisionar.
+            collision_sprites (CollisionSprites): Obstáculos con índice espacial con los que el enemigo puede colisionar.
             enemy_type (str): Tipo de enemigo ('ghost', 'bat', 'skeleton').
             game (Game): Referencia al objeto principal del juego para acceder a configuraciones como el nivel de dificultad.
             drop_sprites (pygame.sprite.Group): Grupo de sprites que representan objetos que el enemigo puede soltar al morir.
@@ -115,18 +150,34 @@ class Enemy(pygame.sprite.Sprite):
             damage (float): Daño ajustado según el nivel de dificultad del juego y limitado por el porcentaje máximo.
             health (int): Salud actual del enemigo.
             frames (list): Fotogramas de animación del enemigo.
+            masks (list): Máscaras de colisión de cada fotograma, precalculadas en Game.load_images.
             frame_index (int): Índice actual del fotograma en la animación.
             image (pygame.Surface): Imagen actual del enemigo.
             animate_speed (int): Velocidad de animación del enemigo.
             rect (pygame.Rect): Rectángulo que define la posición y tamaño del enemigo.
             hitbox_rect (pygame.Rect): Rectángulo de colisión del enemigo.
+            hitbox_position (pygame.Vector2): Esquina superior izquierda de hitbox_rect sin redondear.
             collision_sprites (pygame.sprite.Group): Grupo de sprites con los que el enemigo puede colisionar.
             direction (pygame.Vector2): Dirección de movimiento del enemigo.
             death_time (int): Tiempo en milisegundos desde que el enemigo murió.
+            death_elapsed (float): Milisegundos de simulación transcurridos desde la muerte.
             death_duration (int): Duración en milisegundos de la animación de muerte del enemigo.
+            batch (EnemyBatch): Lote que mueve y anima al enemigo, o None si lo hace él mismo.
+            batch_slot (int): Fila del enemigo en el lote.
+            pool (SpritePool): Pool al que vuelve el enemigo con kill(), o None.
         """
         
-        super().__init__(groups)
+        super().__init__()
+        self.pool = None
+        self.direction = pygame.Vector2()
+        self.spawn(position, frames, groups, player, collision_sprites, enemy_type, game, drop_sprites)
+
+    def spawn(self, position, frames, groups, player, collision_sprites, enemy_type, game, drop_sprites):
+        """
+        Deja al enemigo como recién creado. Lo llama __init__ y el pool al reutilizar una instancia,
+        con los mismos argumentos que __init__.
+        """
+        self.add(groups)
         self.player = player
         self.enemy_type = enemy_type
         self.game = game
@@ -156,18 +207,26 @@ class Enemy(pygame.sprite.Sprite):
         self.health = self.max_health
         
         self.frames, self.frame_index = frames, 0
+        self.masks = game.enemy_masks[enemy_type]
         self.image = self.frames[self.frame_index]
+        self.mask = self.masks[self.frame_index]
         self.animate_speed = 6
         self.rect = self.image.get_rect(center=position)
         self.hitbox_rect = self.rect.inflate(-20, -40)
+        self.hitbox_position = pygame.Vector2(self.hitbox_rect.topleft)
         self.collision_sprites = collision_sprites
-        self.direction = pygame.Vector2()
+        self.direction.update(0, 0)
         self.death_time = 0
+        self.death_elapsed = 0
         self.death_duration = 200
+        self.batch = game.enemy_batch
+        self.batch_slot = self.batch.add(self) if self.batch else None
         
     def animate(self, dt):
         self.frame_index += self.animate_speed * dt
-        self.image = self.frames[int(self.frame_index) % len(self.frames)]
+        index = int(self.frame_index) % len(self.frames)
+        self.image = self.frames[index]
+        self.mask = self.masks[index]
         
     def move(self, dt):
         """
@@ -175,23 +234,35 @@ class Enemy(pygame.sprite.Sprite):
         Args:
             dt (float): Delta de tiempo utilizado para ajustar la velocidad del movimiento.
         Descripción:
-        - Calcula un vector de dirección desde la posición del enemigo hacia la posición del jugador.
-        - Normaliza el vector de dirección para obtener una dirección unitaria.
+        - Toma la dirección del campo de flujo compartido (`game.flow_field`) en el tile del enemigo,
+          que rodea los obstáculos. Los fantasmas atraviesan paredes y van en línea recta.
+        - Si el campo no tiene dirección (mismo tile que el jugador, tile sin camino), calcula un
+          vector desde la posición del enemigo hacia la del jugador y lo normaliza.
         - Actualiza la posición del rectángulo de colisión (hitbox_rect) en los ejes horizontal y vertical.
         - Verifica colisiones en ambos ejes mediante los métodos 'collision'.
         - Ajusta la posición del rectángulo principal (rect) para que coincida con el centro del rectángulo de colisión.
         """
         
-        player_pos = pygame.Vector2(self.player.rect.center)
-        enemy_pos = pygame.Vector2(self.rect.center)
-        direction_vector = player_pos - enemy_pos
-        if direction_vector.length() > 0:
-            self.direction = direction_vector.normalize()
+        flow_direction = None
+        if self.enemy_type != 'ghost' and self.game.flow_field:
+            flow_direction = self.game.flow_field.direction_at(self.hitbox_rect.center)
+        if flow_direction:
+            self.direction = flow_direction
         else:
-            self.direction = pygame.Vector2(0, 0)
-        self.hitbox_rect.x += self.direction.x * self.speed * dt
+            player_pos = pygame.Vector2(self.player.rect.center)
+            enemy_pos = pygame.Vector2(self.rect.center)
+            direction_vector = player_pos - enemy_pos
+            if direction_vector.length() > 0:
+                self.direction = direction_vector.normalize()
+            else:
+                self.direction = pygame.Vector2(0, 0)
+        # la posición se acumula en flotante: con paso fijo, las componentes pequeñas de la dirección
+        # se perdían al redondear el rect y el enemigo no se deslizaba por los bordes
+        self.hitbox_position.x += self.direction.x * self.speed * dt
+        self.hitbox_rect.x = round(self.hitbox_position.x)
         self.collision('horizontal')
-        self.hitbox_rect.y += self.direction.y * self.speed * dt
+        self.hitbox_position.y += self.direction.y * self.speed * dt
+        self.hitbox_rect.y = round(self.hitbox_position.y)
         self.collision('vertical')
         self.rect.center = self.hitbox_rect.center
         
@@ -210,18 +281,21 @@ class Enemy(pygame.sprite.Sprite):
               dependiendo de si el objeto se mueve hacia arriba o hacia abajo.
         Nota:
             Este método asume que los sprites con los que se verifica la colisión tienen un atributo `rect` 
-            que define su área de colisión.
+            que define su área de colisión. Solo se revisan los obstáculos cercanos que devuelve
+            `collision_sprites.nearby`.
         """
         
         if self.enemy_type != 'ghost':
-            for sprite in self.collision_sprites:
+            for sprite in self.collision_sprites.nearby(self.hitbox_rect):
                 if sprite.rect.colliderect(self.hitbox_rect):
                     if direction == 'horizontal':
                         if self.direction.x > 0: self.hitbox_rect.right = sprite.rect.left
                         if self.direction.x < 0: self.hitbox_rect.left = sprite.rect.right
+                        self.hitbox_position.x = self.hitbox_rect.x
                     else:
                         if self.direction.y > 0: self.hitbox_rect.bottom = sprite.rect.top
                         if self.direction.y < 0: self.hitbox_rect.top = sprite.rect.bottom
+                        self.hitbox_position.y = self.hitbox_rect.y
     
     def take_damage(self, damage):
         if self.death_time == 0:
@@ -234,30 +308,32 @@ class Enemy(pygame.sprite.Sprite):
         Destruye el objeto enemigo y realiza las siguientes acciones:
         - Actualiza la puntuación del juego según el tipo de enemigo.
         - Registra el tiempo de destrucción utilizando `pygame.time.get_ticks()`.
-        - Genera una nueva superficie basada en la máscara del primer fotograma del enemigo y 
-          establece el color negro como transparente.
+        - Muestra la silueta blanca del primer fotograma (precalculada en `assets.silhouette`)
+          y usa su máscara para las colisiones.
         - Calcula la probabilidad de soltar un objeto (drop) y, si se cumple, crea un objeto 
           de tipo 'health' o 'battery' en la posición del enemigo destruido.
         Args:
             No recibe argumentos directamente, pero utiliza atributos del objeto como 
             `self.game`, `self.enemy_type`, `self.frames`, `self.rect.center`, y `self.drop_sprites`.
         Nota:
-            Este método depende de las bibliotecas `pygame` y `random`, así como de la clase `Drop`.
+            Este método depende de las bibliotecas `pygame` y `random`, así como del pool de drops del juego (`game.drop_pool`).
         """
         
         self.game.update_score(0, self.enemy_type)
         self.death_time = pygame.time.get_ticks()
-        surface = pygame.mask.from_surface(self.frames[0]).to_surface()
-        surface.set_colorkey('black')
-        self.image = surface
+        self.image = assets.silhouette(self.frames[0])
+        self.mask = self.masks[0]
+        if self.batch:
+            self.batch.mark_dead(self.batch_slot)
         # print(f"{self.enemy_type.capitalize()} destruido, activos: {self.game.enemies_active[self.enemy_type]}")
         drop_probability = self.game.get_drop_probability()
         if random.random() < drop_probability:
             drop_type = random.choices(['health', 'battery'], weights=[0.5, 0.5])[0]
-            Drop(self.rect.center, (self.game.all_sprites, self.drop_sprites), drop_type)
+            self.game.drop_pool.acquire(self.rect.center, (self.game.all_sprites, self.drop_sprites), drop_type)
         
-    def death_timer(self):
-        if pygame.time.get_ticks() - self.death_time >= self.death_duration:
+    def death_timer(self, dt):
+        self.death_elapsed += dt * 1000
+        if self.death_elapsed >= self.death_duration:
             self.kill()
     
     def draw_health_bar(self, surface, offset):
@@ -286,9 +362,20 @@ class Enemy(pygame.sprite.Sprite):
         fill_color = (0, 255, 0) if health_ratio > 0.3 else (255, 0, 0)
         pygame.draw.rect(surface, fill_color, (bar_x, bar_y, fill_width, bar_height))
     
+    def kill(self):
+        if self.alive():
+            if self.batch:
+                self.batch.remove(self)
+            super().kill()
+            if self.pool:
+                self.pool.release(self)
+    
     def update(self, dt):
+        # con lote, el movimiento, la animación y la muerte los calcula EnemyBatch.update
+        if self.batch:
+            return
         if self.death_time == 0:
             self.move(dt)
             self.animate(dt)
         else:
-            self.death_timer()
\ No newline at end of file
+            self.death_timer(dt)
\ No newline at end of file
@@ -0,0 +1,131 @@
+from settings import *
+import os
+import pickle
+
+CACHE_VERSION = 1
+
+# plantillas ya cargadas en memoria, por ruta del TMX
+templates = {}
+
+class WorldTemplate:
+    def __init__(self, width, height, images, ground, objects, collisions, player_position, spawn_positions):
+        """
+        Mapa compilado: todo lo que Game.setup necesita del TMX, sin depender de pytmx.
+        Args:
+            width (int): Ancho del mapa en tiles.
+            height (int): Alto del mapa en tiles.
+            images (list): Superficies únicas de tiles y objetos.
+            ground (list): (x, y, índice de imagen) de cada tile de suelo, en píxeles.
+            objects (list): (x, y, índice de imagen) de cada objeto con colisión.
+            collisions (list): (x, y, ancho, alto) de cada rectángulo de la capa Collisions.
+            player_position (tuple): Posición inicial del jugador o None.
+            spawn_positions (list): Posiciones de aparición de enemigos de la capa Entities.
+        """
+        self.width = width
+        self.height = height
+        self.images = images
+        self.ground = ground
+        self.objects = objects
+        self.collisions = collisions
+        self.player_position = player_position
+        self.spawn_positions = spawn_positions
+
+    @classmethod
+    def from_tmx(cls, tmx_path):
+        # lee el TMX con pytmx (solo cuando no hay caché válida)
+        from pytmx.util_pygame import load_pygame
+        tmx = load_pygame(tmx_path)
+        images = []
+        image_indices = {}
+
+        def image_index(image):
+            if id(image) not in image_indices:
+                image_indices[id(image)] = len(images)
+                images.append(image)
+            return image_indices[id(image)]
+
+        ground = [(x * TILE_SIZE, y * TILE_SIZE, image_index(image)) for x, y, image in tmx.get_layer_by_name('Ground').tiles()]
+        objects = [(obj.x, obj.y, image_index(obj.image)) for obj in tmx.get_layer_by_name('Objects')]
+        collisions = [(obj.x, obj.y, obj.width, obj.height) for obj in tmx.get_layer_by_name('Collisions')]
+        player_position = None
+        spawn_positions = []
+        for obj in tmx.get_layer_by_name('Entities'):
+            if obj.name == 'Player':
+                player_position = (obj.x, obj.y)
+            else:
+                spawn_positions.append((obj.x, obj.y))
+        return cls(tmx.width, tmx.height, images, ground, objects, collisions, player_position, spawn_positions)
+
+    def to_cache(self, source_mtime):
+        # las superficies se guardan como bytes RGBA porque pygame.Surface no se puede serializar
+        return {
+            'version': CACHE_VERSION,
+            'source_mtime': source_mtime,
+            'width': self.width,
+            'height': self.height,
+            'images': [(image.get_size(), pygame.image.tobytes(image, 'RGBA')) for image in self.images],
+            'ground': self.ground,
+            'objects': self.objects,
+            'collisions': self.collisions,
+            'player_position': self.player_position,
+            'spawn_positions': self.spawn_positions,
+        }
+
+    @classmethod
+    def from_cache(cls, data):
+        images = [pygame.image.frombytes(pixels, size, 'RGBA').convert_alpha() for size, pixels in data['images']]
+        return cls(data['width'], data['height'], images, data['ground'], data['objects'], data['collisions'],
+                   data['player_position'], data['spawn_positions'])
+
+def cache_path(tmx_path):
+    return os.path.splitext(tmx_path)[0] + '.cache'
+
+def source_mtime(tmx_path):
+    """
+    Fecha de modificación más reciente del TMX y de los recursos del mapa (tilesets e imágenes).
+    Sirve para invalidar la caché compilada cuando cambia cualquiera de ellos.
+    """
+    map_root = os.path.dirname(os.path.dirname(os.path.abspath(tmx_path)))
+    latest = os.path.getmtime(tmx_path)
+    for folder_path, _, file_names in walk(map_root):
+        for file_name in file_names:
+            if not file_name.endswith('.cache'):
+                latest = max(latest, os.path.getmtime(join(folder_path, file_name)))
+    return latest
+
+def load_world(tmx_path):
+    """
+    Devuelve la plantilla del mapa, en este orden: la que ya está en memoria, la caché compilada
+    junto al TMX si sigue vigente, o el TMX leído con pytmx (y entonces se escribe la caché).
+    Args:
+        tmx_path (str): Ruta del archivo TMX.
+    Returns:
+        WorldTemplate: Plantilla del mapa.
+    """
+    if tmx_path in templates:
+        return templates[tmx_path]
+
+    mtime = source_mtime(tmx_path)
+    template = None
+    try:
+        with open(cache_path(tmx_path), 'rb') as f:
+            data = pickle.load(f)
+        if data.get('version') == CACHE_VERSION and data.get('source_mtime') == mtime:
+            template = WorldTemplate.from_cache(data)
+    except FileNotFoundError:
+        pass
+    except (OSError, pickle.UnpicklingError, EOFError, KeyError, ValueError) as e:
+        print(f"Caché del mapa no disponible ({e}), leyendo {tmx_path}")
+
+    if template is None:
+        template = WorldTemplate.from_tmx(tmx_path)
+        try:
+            temp_path = cache_path(tmx_path) + '.tmp'
+            with open(temp_path, 'wb') as f:
+                pickle.dump(template.to_cache(mtime), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path(tmx_path))
+        except OSError as e:
+            print(f"No se pudo guardar la caché del mapa: {e}")
+
+    templates[tmx_path] = template
+    return template